@@ -1,7 +1,25 @@
 from modules.gui import MISGUI
+from modules.backup import BackupScheduler
+from modules.reminders import ReminderService, LogSink, FileSink, CallbackSink
 import tkinter as tk
 
 if __name__ == "__main__":
+    # Snapshot the databases in the background while the app is open
+    backup_scheduler = BackupScheduler()
+    backup_scheduler.start()
+
     root = tk.Tk()
     app = MISGUI(root)
-    root.mainloop()
\ No newline at end of file
+
+    # Keep the hot database small by archiving meetings older than keep_years
+    app.meeting_manager.archive_in_thread()
+
+    # Remind tutors of upcoming meetings in the log, a file and a popup
+    reminder_service = ReminderService(app.meeting_manager, [LogSink(), FileSink(), CallbackSink(app.show_reminder)])
+    app.reminder_service = reminder_service
+    reminder_service.start_in_thread()
+
+    root.mainloop()
+
+    reminder_service.stop()
+    backup_scheduler.stop()
\ No newline at end of file
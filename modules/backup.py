@@ -0,0 +1,212 @@
+import argparse
+import gzip
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from configparser import ConfigParser
+from datetime import datetime
+from modules.logger import logger
+from modules import change_feed
+
+# Load configuration
+config = ConfigParser()
+config.read("config/config.ini")
+backup_dir = config.get("BACKUP", "backup_dir", fallback="database/backups")
+backup_databases = [
+    path.strip()
+    for path in config.get("BACKUP", "databases", fallback="database/mis.db, database/meetings.db").split(",")
+    if path.strip()
+]
+backup_keep = config.getint("BACKUP", "keep", fallback=7)
+backup_pages_per_step = config.getint("BACKUP", "pages_per_step", fallback=256)
+backup_interval_minutes = config.getint("BACKUP", "interval_minutes", fallback=60)
+
+SNAPSHOT_SUFFIX = ".db.gz"
+
+def snapshot_prefix(db_path):
+    """Return the file name prefix used for snapshots of db_path."""
+    return os.path.splitext(os.path.basename(db_path))[0] + "_"
+
+def list_snapshots(db_path, directory=None):
+    """Return snapshot paths for db_path, newest first."""
+    directory = directory or backup_dir
+    if not os.path.isdir(directory):
+        return []
+    prefix = snapshot_prefix(db_path)
+    pattern = re.compile(re.escape(prefix) + r"\d{8}_\d{6}_\d{6}" + re.escape(SNAPSHOT_SUFFIX) + "$")
+    names = sorted((name for name in os.listdir(directory) if pattern.match(name)), reverse=True)
+    return [os.path.join(directory, name) for name in names]
+
+def rotate_snapshots(db_path, keep=None, directory=None):
+    """Delete all but the newest keep snapshots of db_path. Returns the deleted paths."""
+    keep = backup_keep if keep is None else keep
+    expired = list_snapshots(db_path, directory)[keep:]
+    for path in expired:
+        os.remove(path)
+        logger.info(f"Removed expired snapshot {path}.")
+    return expired
+
+def backup_database(db_path, directory=None, pages=None, keep=None):
+    """Take a compressed snapshot of a live database.
+
+    Pages are copied with the SQLite online backup API in steps of ``pages``,
+    releasing the source lock between steps so writers are not blocked for the
+    length of the copy. Returns the snapshot path and the elapsed seconds.
+    """
+    directory = directory or backup_dir
+    pages = backup_pages_per_step if pages is None else pages
+    os.makedirs(directory, exist_ok=True)
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    snapshot_path = os.path.join(directory, f"{snapshot_prefix(db_path)}{stamp}{SNAPSHOT_SUFFIX}")
+    temp_path = snapshot_path[:-len(".gz")] + ".tmp"
+
+    started = time.perf_counter()
+    steps = 0
+
+    def progress(status, remaining, total):
+        nonlocal steps
+        steps += 1
+        logger.debug(f"Backing up {db_path}: {total - remaining}/{total} pages copied.")
+
+    try:
+        source = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        target = sqlite3.connect(temp_path)
+        try:
+            source.backup(target, pages=pages, progress=progress, sleep=0.001)
+            page_count = target.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            target.close()
+            source.close()
+        copied = time.perf_counter()
+
+        with open(temp_path, "rb") as raw, gzip.open(snapshot_path, "wb") as compressed:
+            shutil.copyfileobj(raw, compressed)
+        elapsed = time.perf_counter() - started
+
+        logger.info(
+            f"Backed up {db_path} to {snapshot_path}: {page_count} pages in {steps} steps, "
+            f"copy {copied - started:.3f}s, total {elapsed:.3f}s, "
+            f"{os.path.getsize(snapshot_path)} bytes compressed."
+        )
+    except (sqlite3.Error, OSError) as e:
+        logger.error(f"Error backing up {db_path}: {e}")
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+        raise
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    rotate_snapshots(db_path, keep, directory)
+    return snapshot_path, elapsed
+
+def restore_database(snapshot_path, db_path):
+    """Restore db_path from a compressed snapshot.
+
+    The snapshot is written back through the backup API, so the restore is a
+    single transaction on db_path and open connections never see a torn file.
+    When db_path has a meeting change log, a restore marker is then written
+    after the pre-restore tokens (see change_feed.record_restore) so sync
+    consumers notice the rollback instead of skipping new changes.
+    """
+    temp_path = snapshot_path + ".restore"
+    started = time.perf_counter()
+    try:
+        with gzip.open(snapshot_path, "rb") as compressed, open(temp_path, "wb") as raw:
+            shutil.copyfileobj(compressed, raw)
+
+        source = sqlite3.connect(temp_path)
+        target = sqlite3.connect(db_path)
+        try:
+            previous_sequence = change_feed.change_log_sequence(target.cursor())
+            source.backup(target)
+            if previous_sequence is not None and change_feed.change_log_sequence(target.cursor()) is not None:
+                change_feed.record_restore(target.cursor(), previous_sequence)
+                target.commit()
+        finally:
+            target.close()
+            source.close()
+        logger.info(f"Restored {db_path} from {snapshot_path} in {time.perf_counter() - started:.3f}s.")
+    except (sqlite3.Error, OSError) as e:
+        logger.error(f"Error restoring {db_path} from {snapshot_path}: {e}")
+        raise
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+class BackupScheduler:
+    """Background thread that snapshots the configured databases periodically."""
+
+    def __init__(self, databases=None, interval_minutes=None, directory=None):
+        self.databases = databases or backup_databases
+        self.interval = 60 * (backup_interval_minutes if interval_minutes is None else interval_minutes)
+        self.directory = directory
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def run_once(self):
+        """Back up every configured database that exists, logging failures."""
+        for db_path in self.databases:
+            if not os.path.exists(db_path):
+                continue
+            try:
+                backup_database(db_path, self.directory)
+            except (sqlite3.Error, OSError):
+                pass  # Already logged; try again next interval
+
+    def _run(self):
+        # Snapshot at start so sessions shorter than the interval are covered
+        self.run_once()
+        while not self._stop_event.wait(self.interval):
+            self.run_once()
+
+    def start(self):
+        """Start the scheduler thread if it is not already running."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="backup-scheduler", daemon=True)
+            self._thread.start()
+            logger.info(f"Backup scheduler started with a {self.interval}s interval.")
+
+    def stop(self):
+        """Stop the scheduler thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            logger.info("Backup scheduler stopped.")
+
+def main(argv=None):
+    """Command line entry point: python -m modules.backup {backup,restore,list}."""
+    parser = argparse.ArgumentParser(description="Back up and restore the meeting databases.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backup_parser = subparsers.add_parser("backup", help="Take a compressed snapshot now.")
+    backup_parser.add_argument("databases", nargs="*", help="Database files (default: configured databases).")
+
+    restore_parser = subparsers.add_parser("restore", help="Restore a database from a snapshot.")
+    restore_parser.add_argument("snapshot", help="Snapshot file to restore from.")
+    restore_parser.add_argument("database", help="Database file to restore into.")
+
+    list_parser = subparsers.add_parser("list", help="List snapshots, newest first.")
+    list_parser.add_argument("databases", nargs="*", help="Database files (default: configured databases).")
+
+    args = parser.parse_args(argv)
+    if args.command == "backup":
+        for db_path in args.databases or backup_databases:
+            snapshot_path, elapsed = backup_database(db_path)
+            print(f"{db_path} -> {snapshot_path} ({elapsed:.3f}s)")
+    elif args.command == "restore":
+        restore_database(args.snapshot, args.database)
+        print(f"Restored {args.database} from {args.snapshot}")
+    elif args.command == "list":
+        for db_path in args.databases or backup_databases:
+            for snapshot_path in list_snapshots(db_path):
+                print(snapshot_path)
+
+if __name__ == "__main__":
+    main()
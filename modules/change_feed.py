@@ -0,0 +1,259 @@
+import argparse
+import json
+import sqlite3
+from modules.logger import logger
+
+NOW_SQL = "strftime('%Y-%m-%d %H:%M:%S', 'now')"
+
+def initialize_change_log(cursor):
+    """Create the change-log table and the triggers that maintain it and the meeting timestamps.
+
+    Triggers are used so every write path (including manual SQL) is tracked.
+    Operations are insert, update and delete, plus archive for rows moved out
+    of the hot database by MeetingManager.archive_meetings and restore for
+    the marker written by record_restore.
+    The first time the log is created, every existing meeting is recorded as
+    an insert so that syncing from token 0 yields the full table.
+    """
+    cursor.execute("PRAGMA table_info(meetings)")
+    existing = {row[1] for row in cursor.fetchall()}
+    for column in ("created_at", "updated_at"):
+        if column not in existing:
+            cursor.execute(f"ALTER TABLE meetings ADD COLUMN {column} TEXT")
+            logger.info(f"Added column '{column}' to meetings table.")
+
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meeting_changes'")
+    needs_backfill = cursor.fetchone() is None
+
+    cursor.executescript(f"""
+        CREATE TABLE IF NOT EXISTS meeting_changes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            meeting_id INTEGER NOT NULL,
+            operation TEXT NOT NULL,
+            changed_at TEXT NOT NULL,
+            entity TEXT NOT NULL DEFAULT 'meeting'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS meetings_timestamps_insert AFTER INSERT ON meetings
+        BEGIN
+            UPDATE meetings
+            SET created_at = coalesce(NEW.created_at, {NOW_SQL}), updated_at = {NOW_SQL}
+            WHERE id = NEW.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS meetings_timestamps_update AFTER UPDATE ON meetings
+        WHEN NEW.updated_at IS OLD.updated_at
+        BEGIN
+            UPDATE meetings SET updated_at = {NOW_SQL} WHERE id = NEW.id AND updated_at IS NOT {NOW_SQL};
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS meetings_changes_insert AFTER INSERT ON meetings
+        BEGIN
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at)
+            VALUES (NEW.id, 'insert', {NOW_SQL});
+        END;
+
+        -- The timestamp triggers' own updates change updated_at and are skipped here
+        CREATE TRIGGER IF NOT EXISTS meetings_changes_update AFTER UPDATE ON meetings
+        WHEN NEW.updated_at IS OLD.updated_at
+        BEGIN
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at)
+            VALUES (NEW.id, 'update', {NOW_SQL});
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS meetings_changes_delete AFTER DELETE ON meetings
+        BEGIN
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at)
+            VALUES (OLD.id, 'delete', {NOW_SQL});
+        END;
+    """)
+
+    # Logs created before series were tracked lack the entity column
+    cursor.execute("PRAGMA table_info(meeting_changes)")
+    if "entity" not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("ALTER TABLE meeting_changes ADD COLUMN entity TEXT NOT NULL DEFAULT 'meeting'")
+        logger.info("Added column 'entity' to meeting_changes table.")
+
+    if needs_backfill:
+        cursor.execute(f"""
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at)
+            SELECT id, 'insert', {NOW_SQL} FROM meetings ORDER BY id
+        """)
+        logger.info(f"Recorded {cursor.rowcount} existing meetings in the change log.")
+
+def initialize_series_change_log(cursor):
+    """Create the triggers recording recurring series changes in the change log.
+
+    Series changes have entity 'series' and the series id in meeting_id.
+    Skipping an occurrence is recorded as an update of its series. The
+    first time the triggers are created, every existing series is recorded
+    as an insert so consumers that synced before series were tracked see them.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'meeting_series_changes_insert'")
+    needs_backfill = cursor.fetchone() is None
+
+    cursor.executescript(f"""
+        CREATE TRIGGER IF NOT EXISTS meeting_series_changes_insert AFTER INSERT ON meeting_series
+        BEGIN
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at, entity)
+            VALUES (NEW.id, 'insert', {NOW_SQL}, 'series');
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS meeting_series_changes_update AFTER UPDATE ON meeting_series
+        BEGIN
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at, entity)
+            VALUES (NEW.id, 'update', {NOW_SQL}, 'series');
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS meeting_series_changes_delete AFTER DELETE ON meeting_series
+        BEGIN
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at, entity)
+            VALUES (OLD.id, 'delete', {NOW_SQL}, 'series');
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS meeting_series_exceptions_changes_insert
+        AFTER INSERT ON meeting_series_exceptions
+        BEGIN
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at, entity)
+            VALUES (NEW.series_id, 'update', {NOW_SQL}, 'series');
+        END;
+
+        -- Exceptions removed along with their series are covered by the series delete
+        CREATE TRIGGER IF NOT EXISTS meeting_series_exceptions_changes_delete
+        AFTER DELETE ON meeting_series_exceptions
+        WHEN EXISTS (SELECT 1 FROM meeting_series WHERE id = OLD.series_id)
+        BEGIN
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at, entity)
+            VALUES (OLD.series_id, 'update', {NOW_SQL}, 'series');
+        END;
+    """)
+
+    if needs_backfill:
+        cursor.execute(f"""
+            INSERT INTO meeting_changes (meeting_id, operation, changed_at, entity)
+            SELECT id, 'insert', {NOW_SQL}, 'series' FROM meeting_series ORDER BY id
+        """)
+        logger.info(f"Recorded {cursor.rowcount} existing meeting series in the change log.")
+
+def latest_token(cursor):
+    """Return the token of the most recent change (0 when the log is empty)."""
+    cursor.execute("SELECT coalesce(max(id), 0) FROM meeting_changes")
+    return cursor.fetchone()[0]
+
+def change_log_sequence(cursor):
+    """Return the change log's AUTOINCREMENT sequence, or None when the database has no change log."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meeting_changes'")
+    if cursor.fetchone() is None:
+        return None
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'meeting_changes'")
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+def record_restore(cursor, previous_sequence):
+    """Record that the database was rolled back to a snapshot.
+
+    Restoring also rolls back the change log, so its ids would be reused and
+    consumers holding a newer token would skip the next changes. The
+    sequence is moved past previous_sequence (its value before the restore)
+    and a restore marker is written after it; consumers that read the
+    marker must discard their state and resync from token 0.
+    """
+    cursor.execute("UPDATE sqlite_sequence SET seq = max(seq, ?) WHERE name = 'meeting_changes'", (previous_sequence,))
+    if cursor.rowcount == 0:
+        cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('meeting_changes', ?)", (previous_sequence,))
+    cursor.execute(f"""
+        INSERT INTO meeting_changes (meeting_id, operation, changed_at, entity)
+        VALUES (0, 'restore', {NOW_SQL}, 'database')
+    """)
+
+def changes_since(conn, token=0, limit=500):
+    """Return changes recorded after token and the token to resume from.
+
+    Each change is ``(token, operation, meeting_id, changed_at, meeting)``
+    where meeting is the row as it is now (a dict), or None once it has been
+    deleted or archived. Recurring series changes use ``S<series id>`` as
+    meeting_id, like their occurrences elsewhere, and carry the series row
+    with an ``exceptions`` list of skipped dates. A ``restore`` change
+    (meeting_id 0) means the database was restored from a snapshot; resync
+    from token 0. Only the change-log range after token is read, so cost
+    scales with the number of changes rather than the table size.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT c.id, c.operation, c.meeting_id, c.changed_at, c.entity, m.*
+        FROM meeting_changes AS c
+        LEFT JOIN meetings AS m ON c.entity = 'meeting' AND m.id = c.meeting_id
+        WHERE c.id > ?
+        ORDER BY c.id
+        LIMIT ?
+    """, (int(token), int(limit)))
+    meeting_columns = [description[0] for description in cursor.description[5:]]
+    rows = cursor.fetchall()
+    series = fetch_series(cursor, {row[2] for row in rows if row[4] == "series"})
+
+    changes = []
+    for row in rows:
+        if row[4] == "series":
+            changes.append((row[0], row[1], f"S{row[2]}", row[3], series.get(row[2])))
+            continue
+        meeting = dict(zip(meeting_columns, row[5:])) if row[5] is not None else None
+        changes.append((row[0], row[1], row[2], row[3], meeting))
+    next_token = changes[-1][0] if changes else int(token)
+    logger.info(f"Read {len(changes)} changes since token {token}.")
+    return changes, next_token
+
+def fetch_series(cursor, series_ids):
+    """Return {id: series row dict with its skipped dates as ``exceptions``} for existing series."""
+    if not series_ids:
+        return {}
+    placeholders = ", ".join("?" * len(series_ids))
+    cursor.execute(f"SELECT * FROM meeting_series WHERE id IN ({placeholders})", list(series_ids))
+    columns = [description[0] for description in cursor.description]
+    series = {row[0]: dict(zip(columns, row), exceptions=[]) for row in cursor.fetchall()}
+    cursor.execute(f"""
+        SELECT series_id, date FROM meeting_series_exceptions
+        WHERE series_id IN ({placeholders})
+        ORDER BY series_id, date
+    """, list(series_ids))
+    for series_id, date in cursor.fetchall():
+        if series_id in series:
+            series[series_id]["exceptions"].append(date)
+    return series
+
+def stream_changes(conn, token=0, batch_size=500):
+    """Yield every change after token, reading the log in batches."""
+    while True:
+        changes, token = changes_since(conn, token, batch_size)
+        yield from changes
+        if len(changes) < batch_size:
+            return
+
+def main(argv=None):
+    """Command line entry point: print changes after a token as JSON lines."""
+    parser = argparse.ArgumentParser(description="Stream meeting and recurring series changes recorded after a sync token.")
+    parser.add_argument("--db", default="database/meetings.db", help="Database file to read changes from.")
+    parser.add_argument("--since", type=int, default=0, help="Token returned by the previous sync (default: 0, everything).")
+    parser.add_argument("--batch-size", type=int, default=500, help="Changes read per query.")
+    args = parser.parse_args(argv)
+
+    conn = sqlite3.connect(args.db)
+    try:
+        token = args.since
+        for token, operation, meeting_id, changed_at, meeting in stream_changes(conn, args.since, args.batch_size):
+            print(json.dumps({
+                "token": token,
+                "operation": operation,
+                "meeting_id": meeting_id,
+                "changed_at": changed_at,
+                "meeting": meeting,
+            }))
+        # Final line carries the token to pass as --since next time
+        print(json.dumps({"next_token": token}))
+    except sqlite3.Error as e:
+        logger.error(f"Error streaming changes: {e}")
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
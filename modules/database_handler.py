@@ -3,6 +3,7 @@ import sqlite3
 import os
 from configparser import ConfigParser
 from modules.logger import logger
+from modules import change_feed
 
 # Load configuration
 config = ConfigParser()
@@ -33,9 +34,14 @@ def initialize_db():
                 date TEXT NOT NULL,
                 time TEXT NOT NULL,
                 topics TEXT NOT NULL,
-                referrals TEXT
+                referrals TEXT,
+                duration INTEGER NOT NULL DEFAULT 60,
+                tutor TEXT,
+                student TEXT
             )
         """)
+        migrate_meetings_table(cursor)
+        change_feed.initialize_change_log(cursor)
         conn.commit()
         logger.info("Database initialized successfully.")
     except sqlite3.Error as e:
@@ -44,6 +50,20 @@ def initialize_db():
     finally:
         conn.close()
 
+def migrate_meetings_table(cursor):
+    """Add columns introduced after the original schema to existing databases."""
+    cursor.execute("PRAGMA table_info(meetings)")
+    existing = {row[1] for row in cursor.fetchall()}
+    new_columns = {
+        "duration": "INTEGER NOT NULL DEFAULT 60",
+        "tutor": "TEXT",
+        "student": "TEXT",
+    }
+    for column, definition in new_columns.items():
+        if column not in existing:
+            cursor.execute(f"ALTER TABLE meetings ADD COLUMN {column} {definition}")
+            logger.info(f"Added column '{column}' to meetings table.")
+
 def validate_date(date):
     """Validate the date format (YYYY-MM-DD)."""
     date_pattern = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])$")
@@ -54,7 +74,14 @@ def validate_time(time):
     time_pattern = re.compile(r"^([01][0-9]|2[0-3]):[0-5][0-9]$")
     return bool(time_pattern.match(time))
 
-def add_meeting(date, time, topics, referrals=""):
+def validate_duration(duration):
+    """Validate the duration as a positive number of minutes."""
+    try:
+        return int(duration) > 0
+    except (TypeError, ValueError):
+        return False
+
+def add_meeting(date, time, topics, referrals="", duration=60, tutor="", student=""):
     """Add a new meeting to the database."""
     # Validate input data
     if not date or not time or not topics:
@@ -66,13 +93,16 @@ def add_meeting(date, time, topics, referrals=""):
     if not validate_time(time):
         return False, f"Invalid time format: {time}. Expected format: HH:MM."
 
+    if not validate_duration(duration):
+        return False, f"Invalid duration: {duration}. Expected a positive number of minutes."
+
     conn = connect_db()
     cursor = conn.cursor()
     try:
         cursor.execute("""
-            INSERT INTO meetings (date, time, topics, referrals)
-            VALUES (?, ?, ?, ?)
-        """, (date, time, topics, referrals))
+            INSERT INTO meetings (date, time, topics, referrals, duration, tutor, student)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (date, time, topics, referrals, int(duration), tutor, student))
         conn.commit()
         logger.info(f"Added meeting: {date}, {time}, {topics}, {referrals}")
         return True, "Meeting added successfully!"
@@ -87,7 +117,7 @@ def get_all_meetings():
     conn = connect_db()
     cursor = conn.cursor()
     try:
-        cursor.execute("SELECT id, date, time, topics, referrals FROM meetings")
+        cursor.execute("SELECT id, date, time, topics, referrals, duration, tutor, student FROM meetings")
         meetings = cursor.fetchall()
         logger.info("Retrieved all meetings.")
         return meetings
@@ -103,7 +133,7 @@ def search_meetings(keyword):
     cursor = conn.cursor()
     try:
         cursor.execute("""
-            SELECT id, date, time, topics, referrals FROM meetings
+            SELECT id, date, time, topics, referrals, duration, tutor, student FROM meetings
             WHERE topics LIKE ? OR referrals LIKE ?
         """, (f"%{keyword}%", f"%{keyword}%"))
         meetings = cursor.fetchall()
@@ -1,20 +1,37 @@
+import re
 import tkinter as tk
+from datetime import date as Date, timedelta
 from tkinter import ttk, messagebox, scrolledtext
 from tkinter.font import Font
 from modules.meeting_manager import MeetingManager
 from modules.logger import logger
 
+# Number of meetings loaded per page of student history
+HISTORY_PAGE_SIZE = 20
+
+# Start of a result-area line for a stored meeting (recurring occurrences use "S<id>")
+MEETING_LINE_PATTERN = re.compile(r"^ID: (\d+),")
+
+# Start of a result-area line for an occurrence of a recurring series
+SERIES_LINE_PATTERN = re.compile(r"^ID: S(\d+), Date: (\d{4}-\d{2}-\d{2}),")
+
+# Repeat choices shown in the add form -> MeetingManager recurrence frequency
+REPEAT_OPTIONS = {"Does not repeat": None, "Weekly": "weekly", "Fortnightly": "fortnightly"}
+
 class MISGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Personal Tutor Meeting Tracker")
-        self.root.geometry("800x700")  # Adjusted window size
+        self.root.geometry("800x950")  # Adjusted window size
         self.root.configure(bg="#F5F5F5")  # Light background
         self.root.overrideredirect(True)  # Remove default title bar
 
         # Initialize MeetingManager
         self.meeting_manager = MeetingManager()
 
+        # Reminder service to notify of new meetings (set by the caller, optional)
+        self.reminder_service = None
+
         # Custom fonts
         self.title_font = Font(family="Helvetica", size=18, weight="bold")
         self.label_font = Font(family="Helvetica", size=12)
@@ -122,6 +139,33 @@ class MISGUI:
         self.referrals_entry = ttk.Entry(add_frame, font=self.label_font, style="TEntry")
         self.referrals_entry.grid(row=3, column=1, padx=5, pady=5, sticky="ew")  # Expand horizontally
 
+        # Duration input
+        ttk.Label(add_frame, text="Duration (minutes):", style="TLabel").grid(row=4, column=0, padx=5, pady=5, sticky="w")
+        self.duration_entry = ttk.Entry(add_frame, font=self.label_font, style="TEntry")
+        self.duration_entry.grid(row=4, column=1, padx=5, pady=5, sticky="ew")  # Expand horizontally
+
+        # Tutor input
+        ttk.Label(add_frame, text="Tutor:", style="TLabel").grid(row=5, column=0, padx=5, pady=5, sticky="w")
+        self.tutor_entry = ttk.Entry(add_frame, font=self.label_font, style="TEntry")
+        self.tutor_entry.grid(row=5, column=1, padx=5, pady=5, sticky="ew")  # Expand horizontally
+
+        # Student input
+        ttk.Label(add_frame, text="Student:", style="TLabel").grid(row=6, column=0, padx=5, pady=5, sticky="w")
+        self.student_entry = ttk.Combobox(add_frame, font=self.label_font)
+        self.student_entry.grid(row=6, column=1, padx=5, pady=5, sticky="ew")  # Expand horizontally
+        self.student_entry.bind("<KeyRelease>", self.autocomplete_student)
+
+        # Recurrence input
+        ttk.Label(add_frame, text="Repeat:", style="TLabel").grid(row=7, column=0, padx=5, pady=5, sticky="w")
+        self.repeat_combobox = ttk.Combobox(add_frame, font=self.label_font, state="readonly", values=list(REPEAT_OPTIONS))
+        self.repeat_combobox.current(0)
+        self.repeat_combobox.grid(row=7, column=1, padx=5, pady=5, sticky="ew")  # Expand horizontally
+
+        # Recurrence end (end of term) input
+        ttk.Label(add_frame, text="Repeat Until (YYYY-MM-DD):", style="TLabel").grid(row=8, column=0, padx=5, pady=5, sticky="w")
+        self.repeat_until_entry = ttk.Entry(add_frame, font=self.label_font, style="TEntry")
+        self.repeat_until_entry.grid(row=8, column=1, padx=5, pady=5, sticky="ew")  # Expand horizontally
+
         # Add meeting button (styled with #5f295f and black text)
         add_button = ttk.Button(
             add_frame,
@@ -129,7 +173,7 @@ class MISGUI:
             command=self.add_meeting,
             style="Accent.TButton"
         )
-        add_button.grid(row=4, column=0, columnspan=2, pady=10, sticky="ew")  # Full width row
+        add_button.grid(row=9, column=0, columnspan=2, pady=10, sticky="ew")  # Full width row
 
         # View/Search frame
         view_frame = ttk.Frame(main_frame)
@@ -169,6 +213,85 @@ class MISGUI:
         )
         clear_button.grid(row=0, column=3, padx=5, pady=5, sticky="ew")  # Place next to the search button
 
+        # Student history buttons (history for the student picked above)
+        history_button = ttk.Button(
+            view_frame,
+            text="Student History",
+            command=self.view_student_history,
+            style="Accent.TButton"
+        )
+        history_button.grid(row=1, column=0, padx=5, pady=5, sticky="w")
+
+        more_history_button = ttk.Button(
+            view_frame,
+            text="More History",
+            command=self.view_more_student_history,
+            style="Accent.TButton"
+        )
+        more_history_button.grid(row=1, column=3, padx=5, pady=5, sticky="ew")
+
+        # Date window inputs; recurring meetings are expanded only inside the window
+        self.range_start_entry = ttk.Entry(view_frame, font=self.label_font, style="TEntry")
+        self.range_start_entry.grid(row=2, column=0, padx=5, pady=5, sticky="ew")
+        self.range_end_entry = ttk.Entry(view_frame, font=self.label_font, style="TEntry")
+        self.range_end_entry.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
+
+        range_button = ttk.Button(
+            view_frame,
+            text="View Date Range",
+            command=self.view_meetings_in_range,
+            style="Accent.TButton"
+        )
+        range_button.grid(row=2, column=2, columnspan=2, padx=5, pady=5, sticky="ew")
+
+        # Actions on meetings selected in the result area
+        edit_button = ttk.Button(
+            view_frame,
+            text="Edit Selected",
+            command=self.edit_selected_meeting,
+            style="Accent.TButton"
+        )
+        edit_button.grid(row=3, column=0, padx=5, pady=5, sticky="ew")
+
+        save_button = ttk.Button(
+            view_frame,
+            text="Save Changes",
+            command=self.save_meeting_changes,
+            style="Accent.TButton"
+        )
+        save_button.grid(row=3, column=1, padx=5, pady=5, sticky="ew")
+
+        delete_button = ttk.Button(
+            view_frame,
+            text="Delete Selected",
+            command=self.delete_selected_meetings,
+            style="Accent.TButton"
+        )
+        delete_button.grid(row=3, column=2, padx=5, pady=5, sticky="ew")
+
+        end_series_button = ttk.Button(
+            view_frame,
+            text="End Series Here",
+            command=self.end_selected_series,
+            style="Accent.TButton"
+        )
+        end_series_button.grid(row=3, column=3, padx=5, pady=5, sticky="ew")
+
+        delete_series_button = ttk.Button(
+            view_frame,
+            text="Delete Whole Series",
+            command=self.delete_selected_series,
+            style="Accent.TButton"
+        )
+        delete_series_button.grid(row=4, column=0, columnspan=4, padx=5, pady=5, sticky="ew")
+
+        # Id of the meeting loaded into the form by Edit Selected
+        self.editing_meeting_id = None
+
+        # Keyset cursor for the student history currently shown
+        self.history_student = None
+        self.history_before = None
+
         # Result text area
         self.result_text = scrolledtext.ScrolledText(
             main_frame,
@@ -179,28 +302,308 @@ class MISGUI:
         )
         self.result_text.pack(fill=tk.BOTH, expand=True, pady=10)
 
+    @staticmethod
+    def format_meeting(meeting):
+        """Format a meeting row as one line of the result area."""
+        return f"ID: {meeting[0]}, Date: {meeting[1]}, Time: {meeting[2]}, Duration: {meeting[5]} min, Tutor: {meeting[6]}, Student: {meeting[7]}, Topics: {meeting[3]}, Referrals: {meeting[4]}"
+
+    @staticmethod
+    def confirm_conflicts(conflicts, action):
+        """Ask whether to go ahead despite conflicting meetings. Returns True when there are none."""
+        if not conflicts:
+            return True
+        details = "\n".join(f"ID: {meeting[0]}, {meeting[1]} {meeting[2]} ({meeting[5]} min), Tutor: {meeting[6]}, Student: {meeting[7]}" for meeting in conflicts)
+        return messagebox.askyesno("Scheduling Conflict", f"This meeting overlaps with:\n\n{details}\n\n{action} it anyway?", icon="warning")
+
+    def selected_lines(self, pattern):
+        """Return (line index, match) for selected result lines matching pattern."""
+        try:
+            first = int(self.result_text.index(tk.SEL_FIRST).split(".")[0])
+            last, last_column = map(int, self.result_text.index(tk.SEL_LAST).split("."))
+        except tk.TclError:
+            return []  # Nothing selected
+        if last_column == 0 and last > first:
+            last -= 1  # Selection ends at the start of the following line
+        selected = []
+        for line in range(first, last + 1):
+            match = pattern.match(self.result_text.get(f"{line}.0", f"{line}.end"))
+            if match:
+                selected.append((line, match))
+        return selected
+
+    def selected_meeting_lines(self):
+        """Return (line index, meeting id) for stored meetings in the selected result lines."""
+        return [(line, int(match.group(1))) for line, match in self.selected_lines(MEETING_LINE_PATTERN)]
+
+    def selected_series_lines(self):
+        """Return (line index, series id, date) for recurring occurrences in the selected result lines."""
+        return [(line, int(match.group(1)), match.group(2)) for line, match in self.selected_lines(SERIES_LINE_PATTERN)]
+
+    def remove_result_line(self, line):
+        """Remove one result line, with the blank spacer line below it when the view uses one."""
+        end = line + 2 if not self.result_text.get(f"{line + 1}.0", f"{line + 1}.end") else line + 1
+        self.result_text.delete(f"{line}.0", f"{end}.0")
+
+    def remove_series_lines(self, series_id, from_date=None):
+        """Remove the result lines of a series' occurrences, optionally only from from_date on."""
+        last = int(self.result_text.index(tk.END).split(".")[0])
+        for line in range(last, 0, -1):  # Bottom-up so earlier line numbers stay valid
+            match = SERIES_LINE_PATTERN.match(self.result_text.get(f"{line}.0", f"{line}.end"))
+            if match and int(match.group(1)) == series_id and (from_date is None or match.group(2) >= from_date):
+                self.remove_result_line(line)
+
+    def find_meeting_line(self, meeting_id):
+        """Return the result-area line showing meeting_id, or None."""
+        index = self.result_text.search(f"^ID: {meeting_id},", "1.0", tk.END, regexp=True)
+        if not index:
+            return None
+        return int(index.split(".")[0])
+
+    def edit_selected_meeting(self):
+        """Load the selected meeting into the form for editing."""
+        selected = self.selected_meeting_lines()
+        if not selected and self.selected_series_lines():
+            messagebox.showwarning("Selection Error", "Recurring meetings cannot be edited. Use End Series Here or Delete Whole Series, then add a new series.")
+            return
+        if len(selected) != 1:
+            messagebox.showwarning("Selection Error", "Please select exactly one meeting to edit.")
+            return
+
+        try:
+            meeting = self.meeting_manager.get_meeting(selected[0][1])
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to retrieve meeting: {e}")
+            return
+        if meeting is None:
+            messagebox.showerror("Error", "The selected meeting no longer exists.")
+            return
+
+        entries = (self.date_entry, self.time_entry, self.topics_entry, self.referrals_entry,
+                   self.duration_entry, self.tutor_entry, self.student_entry)
+        for entry, value in zip(entries, meeting[1:]):
+            entry.delete(0, tk.END)
+            entry.insert(0, "" if value is None else str(value))
+        self.editing_meeting_id = meeting[0]
+
+    def save_meeting_changes(self):
+        """Save the form back to the meeting being edited and update its line in place."""
+        if self.editing_meeting_id is None:
+            messagebox.showwarning("Input Error", "Select a meeting and press Edit Selected first.")
+            return
+
+        meeting_id = self.editing_meeting_id
+        fields = {
+            "date": self.date_entry.get(),
+            "time": self.time_entry.get(),
+            "topics": self.topics_entry.get(),
+            "referrals": self.referrals_entry.get(),
+            "duration": self.duration_entry.get() or 60,
+            "tutor": self.tutor_entry.get(),
+            "student": self.student_entry.get(),
+        }
+
+        # Warn about double-booked tutors or students before saving
+        conflicts = self.meeting_manager.find_conflicts(fields["date"], fields["time"], fields["duration"], fields["tutor"], fields["student"], exclude_id=meeting_id)
+        if not self.confirm_conflicts(conflicts, "Save"):
+            return
+
+        success, message = self.meeting_manager.update_meeting(meeting_id, **fields)
+        if not success:
+            messagebox.showerror("Error", message)
+            return
+
+        # Replace just the edited line rather than reloading the results
+        line = self.find_meeting_line(meeting_id)
+        if line is not None:
+            meeting = self.meeting_manager.get_meeting(meeting_id)
+            self.result_text.delete(f"{line}.0", f"{line}.end")
+            self.result_text.insert(f"{line}.0", self.format_meeting(meeting))
+
+        self.editing_meeting_id = None
+        for entry in (self.date_entry, self.time_entry, self.topics_entry, self.referrals_entry,
+                      self.duration_entry, self.tutor_entry, self.student_entry):
+            entry.delete(0, tk.END)
+        if self.reminder_service is not None:
+            self.reminder_service.notify()
+        messagebox.showinfo("Success", message)
+
+    def delete_selected_meetings(self):
+        """Delete the selected meetings, skip the selected recurring occurrences, and remove their lines."""
+        selected = self.selected_meeting_lines()
+        occurrences = self.selected_series_lines()
+        if not selected and not occurrences:
+            messagebox.showwarning("Selection Error", "Please select the meetings to delete.")
+            return
+        prompt = f"Delete {len(selected)} selected meeting(s)"
+        if occurrences:
+            prompt += f" and cancel {len(occurrences)} recurring occurrence(s)"
+        if not messagebox.askyesno("Delete Meetings", prompt + "?", icon="warning"):
+            return
+
+        messages = []
+        removed_lines = []
+        if selected:
+            success, message = self.meeting_manager.delete_meetings([meeting_id for _, meeting_id in selected])
+            if not success:
+                messagebox.showerror("Error", message)
+                return
+            messages.append(message)
+            removed_lines.extend(line for line, _ in selected)
+            if self.editing_meeting_id in {meeting_id for _, meeting_id in selected}:
+                self.editing_meeting_id = None
+
+        for line, series_id, date in occurrences:
+            success, message = self.meeting_manager.skip_occurrence(series_id, date)
+            if not success:
+                messagebox.showerror("Error", message)
+                break
+            removed_lines.append(line)
+        else:
+            if occurrences:
+                messages.append(f"Cancelled {len(occurrences)} recurring occurrence(s) successfully!")
+
+        for line in sorted(removed_lines, reverse=True):  # Bottom-up so earlier line numbers stay valid
+            self.remove_result_line(line)
+        if self.reminder_service is not None:
+            self.reminder_service.notify()
+        if messages:
+            messagebox.showinfo("Success", "\n".join(messages))
+
+    def delete_selected_series(self):
+        """Delete every occurrence of the selected recurring series and remove their lines."""
+        series_ids = list(dict.fromkeys(series_id for _, series_id, _ in self.selected_series_lines()))
+        if not series_ids:
+            messagebox.showwarning("Selection Error", "Please select an occurrence of the recurring meeting to delete.")
+            return
+        if not messagebox.askyesno("Delete Series", f"Delete {len(series_ids)} recurring meeting(s), including every past and future occurrence?", icon="warning"):
+            return
+
+        messages = []
+        for series_id in series_ids:
+            success, message = self.meeting_manager.delete_series(series_id)
+            if not success:
+                messagebox.showerror("Error", message)
+                break
+            messages.append(message)
+            self.remove_series_lines(series_id)
+
+        if self.reminder_service is not None:
+            self.reminder_service.notify()
+        if messages:
+            messagebox.showinfo("Success", "\n".join(messages))
+
+    def end_selected_series(self):
+        """End the selected recurring series before the selected occurrence."""
+        selected = self.selected_series_lines()
+        if len(selected) != 1:
+            messagebox.showwarning("Selection Error", "Please select exactly one recurring meeting occurrence.")
+            return
+
+        _, series_id, date = selected[0]
+        if not messagebox.askyesno("End Series", f"Stop this recurring meeting from {date} onwards?", icon="warning"):
+            return
+
+        end_date = (Date.fromisoformat(date) - timedelta(days=1)).isoformat()
+        success, message = self.meeting_manager.end_series(series_id, end_date)
+        if not success:
+            messagebox.showerror("Error", message)
+            return
+
+        self.remove_series_lines(series_id, from_date=date)
+        if self.reminder_service is not None:
+            self.reminder_service.notify()
+        messagebox.showinfo("Success", message)
+
     def clear_results(self):
         """Clear the result text area."""
         self.result_text.delete(1.0, tk.END)  # Clear all text
         logger.info("Cleared the result text area.")
 
+    def show_reminder(self, message):
+        """Show a reminder popup. Safe to call from the reminder service thread."""
+        self.root.after(0, lambda: messagebox.showinfo("Meeting Reminder", message))
+
+    def autocomplete_student(self, event):
+        """Offer student names matching what has been typed so far."""
+        prefix = self.student_entry.get()
+        if not prefix:
+            self.student_entry["values"] = ()
+            return
+        try:
+            self.student_entry["values"] = self.meeting_manager.autocomplete_students(prefix)
+        except Exception as e:
+            logger.error(f"Failed to autocomplete students: {e}")
+
+    def view_student_history(self):
+        """Show the most recent meetings for the selected student."""
+        student = self.student_entry.get()
+        if not student:
+            messagebox.showwarning("Input Error", "Please enter or pick a student.")
+            return
+
+        self.history_student = student
+        self.history_before = None
+        self.result_text.delete(1.0, tk.END)  # Clear the text area
+        self.result_text.insert(tk.END, f"--- Meetings with '{student}' ---\n\n")
+        self.view_more_student_history()
+
+    def view_more_student_history(self):
+        """Append the next page of the current student's history."""
+        if self.history_student is None:
+            return
+
+        try:
+            meetings = self.meeting_manager.get_student_history(self.history_student, HISTORY_PAGE_SIZE, self.history_before)
+            if not meetings:
+                self.result_text.insert(tk.END, "No more meetings found.\n")
+                return
+            for meeting in meetings:
+                self.result_text.insert(tk.END, self.format_meeting(meeting) + "\n\n")
+            last = meetings[-1]
+            self.history_before = (last[1], last[2], last[0])
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to retrieve student history: {e}")
+
     def add_meeting(self):
         """Add a new meeting."""
         date = self.date_entry.get()
         time = self.time_entry.get()
         topics = self.topics_entry.get()
         referrals = self.referrals_entry.get()
+        duration = self.duration_entry.get() or 60
+        tutor = self.tutor_entry.get()
+        student = self.student_entry.get()
+        frequency = REPEAT_OPTIONS[self.repeat_combobox.get()]
+
+        # Warn about double-booked tutors or students before saving
+        if frequency:
+            conflicts = self.meeting_manager.find_series_conflicts(date, time, duration, tutor, student, frequency, self.repeat_until_entry.get() or None)
+        else:
+            conflicts = self.meeting_manager.find_conflicts(date, time, duration, tutor, student)
+        if not self.confirm_conflicts(conflicts, "Add"):
+            return
 
-        # Call the add_meeting function and get the result
-        success, message = self.meeting_manager.add_meeting(date, time, topics, referrals)
+        # Call the add_meeting function (or store a series) and get the result
+        if frequency:
+            repeat_until = self.repeat_until_entry.get() or None
+            success, message = self.meeting_manager.add_recurring_meeting(date, time, topics, referrals, duration, tutor, student, frequency, repeat_until)
+        else:
+            success, message = self.meeting_manager.add_meeting(date, time, topics, referrals, duration, tutor, student)
 
         # Display the result in a messagebox
         if success:
             messagebox.showinfo("Success", message)
+            if self.reminder_service is not None:
+                self.reminder_service.notify()
             self.date_entry.delete(0, tk.END)
             self.time_entry.delete(0, tk.END)
             self.topics_entry.delete(0, tk.END)
             self.referrals_entry.delete(0, tk.END)
+            self.duration_entry.delete(0, tk.END)
+            self.tutor_entry.delete(0, tk.END)
+            self.student_entry.delete(0, tk.END)
+            self.repeat_combobox.current(0)
+            self.repeat_until_entry.delete(0, tk.END)
         else:
             messagebox.showerror("Error", message)
 
@@ -214,7 +617,27 @@ class MISGUI:
             else:
                 self.result_text.insert(tk.END, "--- All Meetings ---\n\n")
                 for meeting in meetings:
-                    self.result_text.insert(tk.END, f"ID: {meeting[0]}, Date: {meeting[1]}, Time: {meeting[2]}, Topics: {meeting[3]}, Referrals: {meeting[4]}\n\n")
+                    self.result_text.insert(tk.END, self.format_meeting(meeting) + "\n\n")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to retrieve meetings: {e}")
+
+    def view_meetings_in_range(self):
+        """View meetings, including recurring occurrences, inside a date window."""
+        start_date = self.range_start_entry.get()
+        end_date = self.range_end_entry.get()
+        if not start_date or not end_date:
+            messagebox.showwarning("Input Error", "Please enter a start and end date (YYYY-MM-DD).")
+            return
+
+        try:
+            meetings = self.meeting_manager.view_all_meetings(start_date, end_date)
+            self.result_text.delete(1.0, tk.END)  # Clear the text area
+            if not meetings:
+                self.result_text.insert(tk.END, f"No meetings found between {start_date} and {end_date}.\n")
+            else:
+                self.result_text.insert(tk.END, f"--- Meetings from {start_date} to {end_date} ---\n\n")
+                for meeting in meetings:
+                    self.result_text.insert(tk.END, self.format_meeting(meeting) + "\n\n")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to retrieve meetings: {e}")
 
@@ -226,13 +649,18 @@ class MISGUI:
             return
 
         try:
-            meetings = self.meeting_manager.search_meetings(keyword)
+            meetings = self.meeting_manager.search_meetings(keyword, include_archived=True)
+            heading = f"--- Meetings Matching '{keyword}' ---\n"
+            if not meetings:
+                # Fall back to typo-tolerant matching before giving up
+                meetings = self.meeting_manager.fuzzy_search_meetings(keyword, include_archived=True)
+                heading = f"--- No exact matches for '{keyword}'; closest meetings ---\n"
             self.result_text.delete(1.0, tk.END)  # Clear the text area
             if not meetings:
                 self.result_text.insert(tk.END, f"No meetings found matching '{keyword}'.\n")
             else:
-                self.result_text.insert(tk.END, f"--- Meetings Matching '{keyword}' ---\n")
+                self.result_text.insert(tk.END, heading)
                 for meeting in meetings:
-                    self.result_text.insert(tk.END, f"ID: {meeting[0]}, Date: {meeting[1]}, Time: {meeting[2]}, Topics: {meeting[3]}, Referrals: {meeting[4]}\n")
+                    self.result_text.insert(tk.END, self.format_meeting(meeting) + "\n")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to search meetings: {e}")
\ No newline at end of file
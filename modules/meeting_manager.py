@@ -1,15 +1,72 @@
+import argparse
+import bisect
+import heapq
+import json
+import os
 import re
 import sqlite3
+import threading
+from configparser import ConfigParser
+from datetime import date as Date, datetime, timedelta
+from difflib import SequenceMatcher
 from modules.logger import logger
+from modules import change_feed
+
+# Load configuration
+config = ConfigParser()
+config.read("config/config.ini")
+archive_dir = config.get("ARCHIVE", "archive_dir", fallback="database/archive")
+archive_keep_years = config.getint("ARCHIVE", "keep_years", fallback=1)
+
+# Minutes since the Unix epoch for a meeting's start, used as the interval
+# index coordinate. Kept in SQL so triggers and queries agree on the value.
+START_MINUTE_SQL = "CAST(strftime('%s', {date} || ' ' || {time}) AS INTEGER) / 60"
+
+MEETING_COLUMNS = "id, date, time, topics, referrals, duration, tutor, student"
+
+# Stored meetings overlapping a slot and sharing its tutor or student. The
+# CROSS JOIN keeps the R*Tree range as the outer loop, so the planner cannot
+# switch to the tutor/student timeline indexes and read a participant's whole
+# history. Parameters: date, time, duration, date, time, tutor_id, student_id, exclude_id.
+CONFLICT_SQL = f"""
+    SELECT m.id, m.date, m.time, m.topics, m.referrals, m.duration, m.tutor, m.student
+    FROM meeting_intervals AS mi
+    CROSS JOIN meetings AS m ON m.id = mi.id
+    WHERE mi.start_minute < {START_MINUTE_SQL.format(date="?", time="?")} + ?
+      AND mi.end_minute > {START_MINUTE_SQL.format(date="?", time="?")}
+      AND (m.tutor_id = ? OR m.student_id = ?)
+      AND m.id IS NOT ?
+    ORDER BY m.date, m.time
+"""
+
+# Columns copied verbatim into per-year archive databases
+ARCHIVE_COLUMNS = MEETING_COLUMNS + ", tutor_id, student_id, created_at, updated_at"
+
+# Columns that update_meetings may change and filters may match on
+EDITABLE_COLUMNS = ("date", "time", "topics", "referrals", "duration", "tutor", "student")
+
+# Maximum ids per IN (...) query, below SQLite's bound-parameter limit
+ID_BATCH_SIZE = 500
+
+# Recurrence frequency -> weeks between occurrences
+RECURRENCE_INTERVALS = {"weekly": 1, "fortnightly": 2}
+
+# How far ahead an open-ended new series is checked for conflicts
+SERIES_CONFLICT_HORIZON = timedelta(weeks=52)
+
+# Participant role -> table holding the people who can take that role
+PARTICIPANT_TABLES = {"student": "students", "tutor": "tutors"}
 
 class MeetingManager:
     def __init__(self):
+        self.archive_dir = archive_dir
         self.initialize_db()  # Ensure the table exists when the class is instantiated
 
     def connect_db(self):
         """Connect to the SQLite database."""
         try:
             conn = sqlite3.connect("database/meetings.db")  # Update with your database path
+            conn.execute("PRAGMA foreign_keys = ON")
             logger.info("Connected to the database.")
             return conn
         except sqlite3.Error as e:
@@ -28,6 +85,14 @@ class MeetingManager:
         time_pattern = re.compile(r"^([01][0-9]|2[0-3]):[0-5][0-9]$")
         return bool(time_pattern.match(time))
 
+    @staticmethod
+    def validate_duration(duration):
+        """Validate the duration as a positive number of minutes."""
+        try:
+            return int(duration) > 0
+        except (TypeError, ValueError):
+            return False
+
     def initialize_db(self):
         """Initialize the database with the required tables."""
         conn = self.connect_db()
@@ -39,9 +104,36 @@ class MeetingManager:
                     date TEXT NOT NULL,
                     time TEXT NOT NULL,
                     topics TEXT NOT NULL,
-                    referrals TEXT
+                    referrals TEXT,
+                    duration INTEGER NOT NULL DEFAULT 60,
+                    tutor TEXT,
+                    student TEXT,
+                    tutor_id INTEGER REFERENCES tutors(id),
+                    student_id INTEGER REFERENCES students(id)
                 )
             """)
+            self.initialize_participant_tables(cursor)
+            added_columns = self.migrate_meetings_table(cursor)
+            if "tutor_id" in added_columns or "student_id" in added_columns:
+                self.backfill_participants(cursor)
+            self.initialize_timeline_indexes(cursor, "main")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings (date, time)")
+            self.initialize_interval_index(cursor)
+            self.initialize_trigram_index(cursor)
+            self.initialize_series_tables(cursor)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meeting_audit (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    meeting_id INTEGER NOT NULL,
+                    operation TEXT NOT NULL,
+                    before TEXT,
+                    after TEXT,
+                    audited_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now'))
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_meeting_audit_meeting ON meeting_audit (meeting_id)")
+            change_feed.initialize_change_log(cursor)
+            change_feed.initialize_series_change_log(cursor)
             conn.commit()
             logger.info("Database initialized successfully.")
         except sqlite3.Error as e:
@@ -50,7 +142,283 @@ class MeetingManager:
         finally:
             conn.close()
 
-    def add_meeting(self, date, time, topics, referrals=""):
+    @staticmethod
+    def migrate_meetings_table(cursor):
+        """Add columns introduced after the original schema to existing databases."""
+        cursor.execute("PRAGMA table_info(meetings)")
+        existing = {row[1] for row in cursor.fetchall()}
+        new_columns = {
+            "duration": "INTEGER NOT NULL DEFAULT 60",
+            "tutor": "TEXT",
+            "student": "TEXT",
+            "tutor_id": "INTEGER REFERENCES tutors(id)",
+            "student_id": "INTEGER REFERENCES students(id)",
+        }
+        added = set()
+        for column, definition in new_columns.items():
+            if column not in existing:
+                cursor.execute(f"ALTER TABLE meetings ADD COLUMN {column} {definition}")
+                logger.info(f"Added column '{column}' to meetings table.")
+                added.add(column)
+        return added
+
+    @staticmethod
+    def initialize_participant_tables(cursor):
+        """Create the students and tutors tables referenced by meetings."""
+        for table in PARTICIPANT_TABLES.values():
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+                )
+            """)
+
+    @staticmethod
+    def backfill_participants(cursor):
+        """Link meetings recorded before the participant tables existed to their rows."""
+        for role, table in PARTICIPANT_TABLES.items():
+            cursor.execute(f"""
+                INSERT OR IGNORE INTO {table} (name)
+                SELECT DISTINCT {role} FROM meetings WHERE {role} IS NOT NULL AND {role} != ''
+            """)
+            cursor.execute(f"""
+                UPDATE meetings SET {role}_id = (SELECT id FROM {table} WHERE name = meetings.{role})
+                WHERE {role}_id IS NULL AND {role} IS NOT NULL AND {role} != ''
+            """)
+            logger.info(f"Linked {cursor.rowcount} existing meetings to {table}.")
+
+    @staticmethod
+    def find_participant_id(cursor, role, name):
+        """Return the id of the named student or tutor, or None if unknown."""
+        if not name:
+            return None
+        cursor.execute(f"SELECT id FROM {PARTICIPANT_TABLES[role]} WHERE name = ?", (name,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def get_or_create_participant(cursor, role, name):
+        """Return the id of the named student or tutor, creating the row if needed."""
+        if not name:
+            return None
+        table = PARTICIPANT_TABLES[role]
+        cursor.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+        cursor.execute(f"SELECT id FROM {table} WHERE name = ?", (name,))
+        return cursor.fetchone()[0]
+
+    @staticmethod
+    def initialize_timeline_indexes(cursor, schema):
+        """Create the covering student/tutor timeline indexes used by get_history.
+
+        Each index holds every column get_history selects, so a page is read
+        from the index alone without table lookups.
+        Narrower indexes left by earlier versions are rebuilt.
+        """
+        for role in PARTICIPANT_TABLES:
+            name = f"idx_meetings_{role}_timeline"
+            # id right after the sort key keeps (date, time, id) paging free of a sort step
+            columns = [f"{role}_id", "date", "time", "id"] + [
+                column for column in MEETING_COLUMNS.split(", ") if column not in ("id", "date", "time")
+            ]
+            cursor.execute(f"PRAGMA {schema}.index_info({name})")
+            existing = [row[2] for row in sorted(cursor.fetchall())]
+            if existing == columns:
+                continue
+            if existing:
+                cursor.execute(f"DROP INDEX {schema}.{name}")
+                logger.info(f"Rebuilding {name} as a covering index.")
+            cursor.execute(f"CREATE INDEX {schema}.{name} ON meetings ({', '.join(columns)})")
+
+    @staticmethod
+    def initialize_interval_index(cursor):
+        """Create the R*Tree index over meeting intervals and the triggers that maintain it."""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meeting_intervals'")
+        needs_backfill = cursor.fetchone() is None
+
+        new_start = START_MINUTE_SQL.format(date="NEW.date", time="NEW.time")
+        cursor.executescript(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS meeting_intervals USING rtree_i32(
+                id, start_minute, end_minute
+            );
+
+            CREATE TRIGGER IF NOT EXISTS meetings_interval_insert AFTER INSERT ON meetings
+            BEGIN
+                INSERT INTO meeting_intervals (id, start_minute, end_minute)
+                VALUES (NEW.id, {new_start}, {new_start} + NEW.duration);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS meetings_interval_update
+            AFTER UPDATE OF date, time, duration ON meetings
+            BEGIN
+                DELETE FROM meeting_intervals WHERE id = OLD.id;
+                INSERT INTO meeting_intervals (id, start_minute, end_minute)
+                VALUES (NEW.id, {new_start}, {new_start} + NEW.duration);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS meetings_interval_delete AFTER DELETE ON meetings
+            BEGIN
+                DELETE FROM meeting_intervals WHERE id = OLD.id;
+            END;
+        """)
+
+        if needs_backfill:
+            start = START_MINUTE_SQL.format(date="date", time="time")
+            cursor.execute(f"""
+                INSERT INTO meeting_intervals (id, start_minute, end_minute)
+                SELECT id, {start}, {start} + duration FROM meetings
+            """)
+            logger.info(f"Indexed {cursor.rowcount} existing meetings for conflict detection.")
+
+    @staticmethod
+    def initialize_trigram_index(cursor):
+        """Create the FTS5 trigram index over topics and referrals and the triggers that maintain it."""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meetings_trigram'")
+        needs_rebuild = cursor.fetchone() is None
+
+        cursor.executescript("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS meetings_trigram USING fts5(
+                topics, referrals, content = 'meetings', content_rowid = 'id', tokenize = 'trigram'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS meetings_trigram_insert AFTER INSERT ON meetings
+            BEGIN
+                INSERT INTO meetings_trigram (rowid, topics, referrals)
+                VALUES (NEW.id, NEW.topics, NEW.referrals);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS meetings_trigram_update
+            AFTER UPDATE OF topics, referrals ON meetings
+            BEGIN
+                INSERT INTO meetings_trigram (meetings_trigram, rowid, topics, referrals)
+                VALUES ('delete', OLD.id, OLD.topics, OLD.referrals);
+                INSERT INTO meetings_trigram (rowid, topics, referrals)
+                VALUES (NEW.id, NEW.topics, NEW.referrals);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS meetings_trigram_delete AFTER DELETE ON meetings
+            BEGIN
+                INSERT INTO meetings_trigram (meetings_trigram, rowid, topics, referrals)
+                VALUES ('delete', OLD.id, OLD.topics, OLD.referrals);
+            END;
+        """)
+
+        if needs_rebuild:
+            cursor.execute("INSERT INTO meetings_trigram (meetings_trigram) VALUES ('rebuild')")
+            logger.info("Built trigram index for existing meetings.")
+
+    @staticmethod
+    def initialize_series_tables(cursor):
+        """Create the tables holding recurring meeting series and their skipped dates."""
+        cursor.executescript("""
+            CREATE TABLE IF NOT EXISTS meeting_series (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                start_date TEXT NOT NULL,
+                end_date TEXT,
+                interval_weeks INTEGER NOT NULL,
+                time TEXT NOT NULL,
+                topics TEXT NOT NULL,
+                referrals TEXT,
+                duration INTEGER NOT NULL DEFAULT 60,
+                tutor TEXT,
+                student TEXT,
+                tutor_id INTEGER REFERENCES tutors(id),
+                student_id INTEGER REFERENCES students(id)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_meeting_series_start
+                ON meeting_series (start_date);
+
+            CREATE TABLE IF NOT EXISTS meeting_series_exceptions (
+                series_id INTEGER NOT NULL REFERENCES meeting_series(id) ON DELETE CASCADE,
+                date TEXT NOT NULL,
+                PRIMARY KEY (series_id, date)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_meeting_series_exceptions_date
+                ON meeting_series_exceptions (date);
+        """)
+
+    def find_conflicts(self, date, time, duration=60, tutor="", student="", exclude_id=None):
+        """Find meetings that overlap the given slot and share its tutor or student.
+
+        Overlapping intervals are located through the R*Tree index, so only
+        candidate meetings in the slot are read rather than the whole table.
+        Returns an empty list when no tutor or student is given, or when the
+        slot itself is invalid (add_meeting reports those errors).
+        """
+        if not (self.validate_date(date) and self.validate_time(time)):
+            return []
+        return self.find_slot_conflicts([date], time, duration, tutor, student, exclude_id)
+
+    def find_series_conflicts(self, start_date, time, duration=60, tutor="", student="",
+                              frequency="weekly", end_date=None):
+        """Find meetings overlapping any occurrence of a proposed recurring series.
+
+        Open-ended series are checked up to SERIES_CONFLICT_HORIZON ahead.
+        Returns an empty list when the series itself is invalid
+        (add_recurring_meeting reports those errors).
+        """
+        if frequency not in RECURRENCE_INTERVALS or not self.validate_time(time):
+            return []
+        try:
+            first = Date.fromisoformat(start_date)
+            last = Date.fromisoformat(end_date) if end_date else first + SERIES_CONFLICT_HORIZON
+        except (TypeError, ValueError):
+            return []
+
+        days = [day.isoformat() for day in self.series_dates(first, last, RECURRENCE_INTERVALS[frequency], first, last)]
+        return self.find_slot_conflicts(days, time, duration, tutor, student)
+
+    def find_slot_conflicts(self, dates, time, duration, tutor, student, exclude_id=None):
+        """Find meetings overlapping a slot at time on any of dates (sorted, valid YYYY-MM-DD).
+
+        Every slot is checked on one connection, and recurring series are
+        expanded once over the whole span rather than per slot.
+        """
+        if not dates or (not tutor and not student) or not self.validate_duration(duration):
+            return []
+        try:
+            slots = [datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M") for date in dates]
+        except ValueError:
+            return []  # e.g. 2023-02-30, which passes validate_date
+
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            # Match participants by id so names compare like the NOCASE participant tables
+            tutor_id = self.find_participant_id(cursor, "tutor", tutor)
+            student_id = self.find_participant_id(cursor, "student", student)
+            if tutor_id is None and student_id is None:
+                return []
+            conflicts = []
+            for date in dates:
+                cursor.execute(CONFLICT_SQL, (date, time, int(duration), date, time, tutor_id, student_id, exclude_id))
+                conflicts.extend(cursor.fetchall())
+        except sqlite3.Error as e:
+            logger.error(f"Error checking meeting conflicts: {e}")
+            raise
+        finally:
+            conn.close()
+
+        # Recurring occurrences are not in the interval index; expand the slots' span
+        length = timedelta(minutes=int(duration))
+        first_day = (slots[0] - timedelta(days=1)).date().isoformat()  # Occurrences running past midnight
+        last_day = (slots[-1] + length).date().isoformat()
+        for occurrence in self.expand_occurrences(first_day, last_day, tutor_id, student_id):
+            occurrence_start = datetime.strptime(f"{occurrence[1]} {occurrence[2]}", "%Y-%m-%d %H:%M")
+            occurrence_end = occurrence_start + timedelta(minutes=occurrence[5])
+            # Only slots starting before the occurrence ends can overlap it
+            index = bisect.bisect_left(slots, occurrence_end)
+            if index and slots[index - 1] + length > occurrence_start:
+                conflicts.append(occurrence)
+        conflicts.sort(key=lambda meeting: (meeting[1], meeting[2]))
+
+        if conflicts:
+            logger.info(f"Found {len(conflicts)} meetings conflicting with {len(dates)} slot(s) from {dates[0]} {time}.")
+        return conflicts
+
+    def add_meeting(self, date, time, topics, referrals="", duration=60, tutor="", student="",
+                    reject_conflicts=False):
         """Add a new meeting to the database."""
         # Validate input data
         if not date or not time or not topics:
@@ -62,13 +430,24 @@ class MeetingManager:
         if not MeetingManager.validate_time(time):  # Call the static method directly
             return False, f"Invalid time format: {time}. Expected format: HH:MM."
 
+        if not MeetingManager.validate_duration(duration):
+            return False, f"Invalid duration: {duration}. Expected a positive number of minutes."
+
+        if reject_conflicts:
+            conflicts = self.find_conflicts(date, time, duration, tutor, student)
+            if conflicts:
+                ids = ", ".join(str(meeting[0]) for meeting in conflicts)
+                return False, f"Scheduling conflict with meeting(s): {ids}."
+
         conn = self.connect_db()
         cursor = conn.cursor()
         try:
+            tutor_id = self.get_or_create_participant(cursor, "tutor", tutor)
+            student_id = self.get_or_create_participant(cursor, "student", student)
             cursor.execute("""
-                INSERT INTO meetings (date, time, topics, referrals)
-                VALUES (?, ?, ?, ?)
-            """, (date, time, topics, referrals))
+                INSERT INTO meetings (date, time, topics, referrals, duration, tutor, student, tutor_id, student_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (date, time, topics, referrals, int(duration), tutor, student, tutor_id, student_id))
             conn.commit()
             logger.info(f"Added meeting: {date}, {time}, {topics}, {referrals}")
             return True, "Meeting added successfully!"
@@ -78,13 +457,214 @@ class MeetingManager:
         finally:
             conn.close()
 
-    def view_all_meetings(self):
-        """Retrieve all meetings from the database."""
+    def add_recurring_meeting(self, start_date, time, topics, referrals="", duration=60, tutor="", student="",
+                              frequency="weekly", end_date=None, reject_conflicts=False):
+        """Add a recurring meeting series, stored as a single row.
+
+        Occurrences fall every week or fortnight from start_date, up to and
+        including end_date (the end of term) when given, and are expanded only
+        when a date window is read.
+        """
+        if not start_date or not time or not topics:
+            return False, "Invalid input: date, time, and topics are required."
+
+        if not MeetingManager.validate_date(start_date):
+            return False, f"Invalid date format: {start_date}. Expected format: YYYY-MM-DD."
+
+        if end_date and not MeetingManager.validate_date(end_date):
+            return False, f"Invalid date format: {end_date}. Expected format: YYYY-MM-DD."
+
+        try:
+            Date.fromisoformat(start_date)
+            if end_date:
+                Date.fromisoformat(end_date)
+        except ValueError as e:
+            return False, f"Invalid date: {e}."
+
+        if end_date and end_date < start_date:
+            return False, f"Invalid end date: {end_date} is before {start_date}."
+
+        if not MeetingManager.validate_time(time):
+            return False, f"Invalid time format: {time}. Expected format: HH:MM."
+
+        if not MeetingManager.validate_duration(duration):
+            return False, f"Invalid duration: {duration}. Expected a positive number of minutes."
+
+        if frequency not in RECURRENCE_INTERVALS:
+            return False, f"Invalid frequency: {frequency}. Expected one of: {', '.join(RECURRENCE_INTERVALS)}."
+
+        if reject_conflicts:
+            conflicts = self.find_series_conflicts(start_date, time, duration, tutor, student, frequency, end_date)
+            if conflicts:
+                ids = ", ".join(dict.fromkeys(str(meeting[0]) for meeting in conflicts))
+                return False, f"Scheduling conflict with meeting(s): {ids}."
+
         conn = self.connect_db()
         cursor = conn.cursor()
         try:
-            cursor.execute("SELECT id, date, time, topics, referrals FROM meetings")
-            meetings = cursor.fetchall()
+            tutor_id = self.get_or_create_participant(cursor, "tutor", tutor)
+            student_id = self.get_or_create_participant(cursor, "student", student)
+            cursor.execute("""
+                INSERT INTO meeting_series (start_date, end_date, interval_weeks, time, topics, referrals,
+                                            duration, tutor, student, tutor_id, student_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (start_date, end_date or None, RECURRENCE_INTERVALS[frequency], time, topics, referrals,
+                  int(duration), tutor, student, tutor_id, student_id))
+            conn.commit()
+            logger.info(f"Added {frequency} meeting series from {start_date}: {time}, {topics}, {referrals}")
+            return True, "Recurring meeting added successfully!"
+        except sqlite3.Error as e:
+            logger.error(f"Error adding recurring meeting: {e}")
+            return False, f"Failed to add recurring meeting: {e}"
+        finally:
+            conn.close()
+
+    def skip_occurrence(self, series_id, date):
+        """Cancel a single occurrence of a recurring meeting series."""
+        if not MeetingManager.validate_date(date):
+            return False, f"Invalid date format: {date}. Expected format: YYYY-MM-DD."
+
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                INSERT OR IGNORE INTO meeting_series_exceptions (series_id, date) VALUES (?, ?)
+            """, (series_id, date))
+            conn.commit()
+            logger.info(f"Skipped occurrence of series {series_id} on {date}.")
+            return True, "Occurrence skipped successfully!"
+        except sqlite3.Error as e:
+            logger.error(f"Error skipping occurrence: {e}")
+            return False, f"Failed to skip occurrence: {e}"
+        finally:
+            conn.close()
+
+    def end_series(self, series_id, end_date):
+        """Stop a recurring series after end_date, keeping earlier occurrences."""
+        if not MeetingManager.validate_date(end_date):
+            return False, f"Invalid date format: {end_date}. Expected format: YYYY-MM-DD."
+
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                UPDATE meeting_series SET end_date = ?
+                WHERE id = ? AND (end_date IS NULL OR end_date > ?)
+            """, (end_date, series_id, end_date))
+            conn.commit()
+            if cursor.rowcount == 0:
+                return False, f"No recurring meeting {series_id} running after {end_date}."
+            logger.info(f"Ended series {series_id} on {end_date}.")
+            return True, "Recurring meeting ended successfully!"
+        except sqlite3.Error as e:
+            logger.error(f"Error ending series: {e}")
+            return False, f"Failed to end recurring meeting: {e}"
+        finally:
+            conn.close()
+
+    def delete_series(self, series_id):
+        """Delete a recurring series and its skipped dates."""
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("DELETE FROM meeting_series WHERE id = ?", (series_id,))
+            deleted = cursor.rowcount
+            cursor.execute("DELETE FROM meeting_series_exceptions WHERE series_id = ?", (series_id,))
+            conn.commit()
+            if deleted == 0:
+                return False, f"No recurring meeting {series_id} found."
+            logger.info(f"Deleted series {series_id}.")
+            return True, "Recurring meeting deleted successfully!"
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting series: {e}")
+            return False, f"Failed to delete recurring meeting: {e}"
+        finally:
+            conn.close()
+
+    @staticmethod
+    def series_dates(first, last, interval_weeks, window_start, window_end):
+        """Yield the dates of a series from first to last (None: open-ended) inside a window."""
+        step = timedelta(weeks=interval_weeks)
+        day = first
+        if day < window_start:
+            # Jump straight to the first occurrence inside the window
+            day += step * -((day - window_start) // step)
+        last_day = min(window_end, last) if last else window_end
+        while day <= last_day:
+            yield day
+            day += step
+
+    def expand_occurrences(self, start_date, end_date, tutor_id=None, student_id=None):
+        """Yield occurrences of recurring series between start_date and end_date inclusive.
+
+        Only series overlapping the window and exceptions inside it are read;
+        occurrences are generated on demand in (date, time) order. Each is
+        shaped like a meeting row, with ``S<series id>`` in place of the id.
+        When tutor_id or student_id is given, only series with that tutor or
+        student are expanded.
+        """
+        query = """
+            SELECT id, start_date, end_date, interval_weeks, time, topics, referrals, duration, tutor, student
+            FROM meeting_series
+            WHERE start_date <= ? AND (end_date IS NULL OR end_date >= ?)
+        """
+        params = [end_date, start_date]
+        if tutor_id is not None or student_id is not None:
+            query += " AND (tutor_id = ? OR student_id = ?)"
+            params.extend([tutor_id, student_id])
+
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, params)
+            series = cursor.fetchall()
+            cursor.execute("""
+                SELECT series_id, date FROM meeting_series_exceptions WHERE date BETWEEN ? AND ?
+            """, (start_date, end_date))
+            exceptions = set(cursor.fetchall())
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving meeting series: {e}")
+            raise
+        finally:
+            conn.close()
+
+        window_start, window_end = Date.fromisoformat(start_date), Date.fromisoformat(end_date)
+
+        def occurrences(row):
+            series_id, first, last, interval_weeks, time, topics, referrals, duration, tutor, student = row
+            last = Date.fromisoformat(last) if last else None
+            for day in self.series_dates(Date.fromisoformat(first), last, interval_weeks, window_start, window_end):
+                date = day.isoformat()
+                if (series_id, date) not in exceptions:
+                    yield (f"S{series_id}", date, time, topics, referrals, duration, tutor, student)
+
+        yield from heapq.merge(*(occurrences(row) for row in series), key=lambda meeting: (meeting[1], meeting[2]))
+
+    def view_all_meetings(self, start_date=None, end_date=None):
+        """Retrieve all meetings from the database, including archived ones.
+
+        Without a window every archive database is attached in turn and the
+        stored meetings are returned in id order. When a start_date/end_date
+        window is given, recurring series in it are included as well (see
+        get_meetings_in_range).
+        """
+        if start_date and end_date:
+            return self.get_meetings_in_range(start_date, end_date)
+
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            meetings = []
+            for year in self.archive_years():
+                cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path(year),))
+                try:
+                    cursor.execute(f"SELECT {MEETING_COLUMNS} FROM archive.meetings")
+                    meetings.extend(cursor.fetchall())
+                finally:
+                    cursor.execute("DETACH DATABASE archive")
+            cursor.execute(f"SELECT {MEETING_COLUMNS} FROM main.meetings")
+            meetings.extend(cursor.fetchall())
+            meetings.sort(key=lambda meeting: meeting[0])
             logger.info("Retrieved all meetings.")
             return meetings
         except sqlite3.Error as e:
@@ -93,20 +673,607 @@ class MeetingManager:
         finally:
             conn.close()
 
-    def search_meetings(self, keyword):
-        """Search meetings by keyword in topics or referrals."""
+    def get_meeting(self, meeting_id):
+        """Retrieve a single meeting by id, or None if it does not exist.
+
+        Meetings not in the hot database are looked up in the archives,
+        newest year first.
+        """
         conn = self.connect_db()
         cursor = conn.cursor()
         try:
-            cursor.execute("""
-                SELECT id, date, time, topics, referrals FROM meetings
-                WHERE topics LIKE ? OR referrals LIKE ?
-            """, (f"%{keyword}%", f"%{keyword}%"))
+            cursor.execute(f"SELECT {MEETING_COLUMNS} FROM main.meetings WHERE id = ?", (meeting_id,))
+            meeting = cursor.fetchone()
+            for year in reversed(self.archive_years()):
+                if meeting is not None:
+                    break
+                cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path(year),))
+                try:
+                    cursor.execute(f"SELECT {MEETING_COLUMNS} FROM archive.meetings WHERE id = ?", (meeting_id,))
+                    meeting = cursor.fetchone()
+                finally:
+                    cursor.execute("DETACH DATABASE archive")
+            return meeting
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving meeting {meeting_id}: {e}")
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def validate_fields(fields):
+        """Return an error message for invalid meeting field values, or None."""
+        unknown = set(fields) - set(EDITABLE_COLUMNS)
+        if unknown:
+            return f"Invalid field(s): {', '.join(sorted(unknown))}."
+        if "topics" in fields and not fields["topics"]:
+            return "Invalid input: date, time, and topics are required."
+        if "date" in fields and not MeetingManager.validate_date(fields["date"] or ""):
+            return f"Invalid date format: {fields['date']}. Expected format: YYYY-MM-DD."
+        if "time" in fields and not MeetingManager.validate_time(fields["time"] or ""):
+            return f"Invalid time format: {fields['time']}. Expected format: HH:MM."
+        if "duration" in fields and not MeetingManager.validate_duration(fields["duration"]):
+            return f"Invalid duration: {fields['duration']}. Expected a positive number of minutes."
+        return None
+
+    @staticmethod
+    def select_meeting_ids(cursor, meeting_ids=None, filters=None):
+        """Return ids of existing meetings in meeting_ids and/or matching every filter column."""
+        if meeting_ids is None and not filters:
+            raise ValueError("Either meeting_ids or filters must be given.")
+        filters = filters or {}
+        unknown = set(filters) - set(EDITABLE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Invalid filter field(s): {', '.join(sorted(unknown))}.")
+
+        conditions = " AND ".join(f"{column} = ?" for column in filters) or "1"
+        if meeting_ids is None:
+            cursor.execute(f"SELECT id FROM meetings WHERE {conditions}", list(filters.values()))
+            return [row[0] for row in cursor.fetchall()]
+
+        meeting_ids = list(dict.fromkeys(meeting_ids))
+        selected = []
+        for i in range(0, len(meeting_ids), ID_BATCH_SIZE):
+            batch = meeting_ids[i:i + ID_BATCH_SIZE]
+            cursor.execute(f"""
+                SELECT id FROM meetings
+                WHERE id IN ({", ".join("?" * len(batch))}) AND {conditions}
+            """, batch + list(filters.values()))
+            selected.extend(row[0] for row in cursor.fetchall())
+        return selected
+
+    @staticmethod
+    def fetch_images(cursor, meeting_ids):
+        """Return {id: row dict} for the given meetings, read in batches."""
+        images = {}
+        for i in range(0, len(meeting_ids), ID_BATCH_SIZE):
+            batch = meeting_ids[i:i + ID_BATCH_SIZE]
+            cursor.execute(f"SELECT * FROM meetings WHERE id IN ({', '.join('?' * len(batch))})", batch)
+            columns = [description[0] for description in cursor.description]
+            for row in cursor.fetchall():
+                images[row[0]] = dict(zip(columns, row))
+        return images
+
+    @staticmethod
+    def write_audit(cursor, operation, before, after):
+        """Record before/after images of changed meetings in one batched insert."""
+        cursor.executemany("""
+            INSERT INTO meeting_audit (meeting_id, operation, before, after) VALUES (?, ?, ?, ?)
+        """, [
+            (meeting_id, operation, json.dumps(image),
+             json.dumps(after[meeting_id]) if meeting_id in after else None)
+            for meeting_id, image in before.items()
+        ])
+
+    def update_meetings(self, meeting_ids=None, filters=None, **fields):
+        """Set the same field values on several meetings, selected by id list and/or filters.
+
+        filters maps column names to values that must match exactly. All
+        rows are updated with one executemany in a single transaction, and
+        their before/after images are written to meeting_audit in the same
+        transaction. Archived meetings given by id are first moved back into
+        the hot database (see unarchive_meetings); filters match hot meetings
+        only.
+        """
+        if not fields:
+            return False, "Invalid input: no fields to update."
+        error = self.validate_fields(fields)
+        if error:
+            return False, error
+        if "duration" in fields:
+            fields["duration"] = int(fields["duration"])
+        if meeting_ids is not None:
+            self.unarchive_meetings(meeting_ids)
+
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            ids = self.select_meeting_ids(cursor, meeting_ids, filters)
+            if not ids:
+                return False, "No matching meetings found."
+
+            for role in PARTICIPANT_TABLES:
+                if role in fields:
+                    fields[f"{role}_id"] = self.get_or_create_participant(cursor, role, fields[role])
+
+            before = self.fetch_images(cursor, ids)
+            assignments = ", ".join(f"{column} = ?" for column in fields)
+            values = list(fields.values())
+            cursor.executemany(f"UPDATE meetings SET {assignments} WHERE id = ?",
+                               [values + [meeting_id] for meeting_id in ids])
+            after = self.fetch_images(cursor, ids)
+            self.write_audit(cursor, "update", before, after)
+            conn.commit()
+            logger.info(f"Updated {len(ids)} meetings: {fields}")
+            return True, f"Updated {len(ids)} meeting(s) successfully!"
+        except ValueError as e:
+            return False, str(e)
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Error updating meetings: {e}")
+            return False, f"Failed to update meetings: {e}"
+        finally:
+            conn.close()
+
+    def update_meeting(self, meeting_id, **fields):
+        """Update fields of a single meeting."""
+        return self.update_meetings([meeting_id], **fields)
+
+    def delete_meetings(self, meeting_ids=None, filters=None):
+        """Delete several meetings, selected by id list and/or filters, in one transaction.
+
+        Before images of the deleted rows are written to meeting_audit.
+        Archived meetings given by id are first moved back into the hot
+        database (see unarchive_meetings); filters match hot meetings only.
+        """
+        if meeting_ids is not None:
+            self.unarchive_meetings(meeting_ids)
+
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            ids = self.select_meeting_ids(cursor, meeting_ids, filters)
+            if not ids:
+                return False, "No matching meetings found."
+
+            before = self.fetch_images(cursor, ids)
+            cursor.executemany("DELETE FROM meetings WHERE id = ?", [(meeting_id,) for meeting_id in ids])
+            self.write_audit(cursor, "delete", before, {})
+            conn.commit()
+            logger.info(f"Deleted {len(ids)} meetings: {ids}")
+            return True, f"Deleted {len(ids)} meeting(s) successfully!"
+        except ValueError as e:
+            return False, str(e)
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Error deleting meetings: {e}")
+            return False, f"Failed to delete meetings: {e}"
+        finally:
+            conn.close()
+
+    def delete_meeting(self, meeting_id):
+        """Delete a single meeting."""
+        return self.delete_meetings([meeting_id])
+
+    def get_history(self, role, name, limit=20, before=None):
+        """Retrieve one page of a student's or tutor's meetings, newest first.
+
+        Pages are keyed on (date, time, id) rather than OFFSET so every page is
+        a single range scan of the participant's covering timeline index. Pass the
+        ``(date, time, id)`` of the last meeting returned as ``before`` to get
+        the next page. When the hot database cannot fill a page, paging
+        continues into the archive databases, newest year first.
+        """
+        limit = int(limit)
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            participant_id = self.find_participant_id(cursor, role, name)
+            if participant_id is None:
+                return []
+
+            query = f"SELECT {MEETING_COLUMNS} FROM {{schema}}.meetings WHERE {role}_id = ?"
+            params = [participant_id]
+            if before is not None:
+                query += " AND (date, time, id) < (?, ?, ?)"
+                params.extend(before)
+            query += " ORDER BY date DESC, time DESC, id DESC LIMIT ?"
+            params.append(limit)
+
+            cursor.execute(query.format(schema="main"), params)
             meetings = cursor.fetchall()
+            for year in reversed(self.archive_years()):
+                if before is not None and year > int(before[0][:4]):
+                    continue
+                # Every archived row in this year is older than a full page already found
+                if len(meetings) >= limit and f"{year + 1:04d}" <= meetings[limit - 1][1]:
+                    break
+                cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path(year),))
+                try:
+                    cursor.execute(query.format(schema="archive"), params)
+                    meetings.extend(cursor.fetchall())
+                finally:
+                    cursor.execute("DETACH DATABASE archive")
+                meetings.sort(key=lambda meeting: (meeting[1], meeting[2], meeting[0]), reverse=True)
+
+            meetings = meetings[:limit]
+            logger.info(f"Retrieved {len(meetings)} meetings for {role} '{name}'.")
+            return meetings
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving {role} history: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def get_student_history(self, student, limit=20, before=None):
+        """Retrieve one page of a student's meetings, newest first."""
+        return self.get_history("student", student, limit, before)
+
+    def get_tutor_history(self, tutor, limit=20, before=None):
+        """Retrieve one page of a tutor's meetings, newest first."""
+        return self.get_history("tutor", tutor, limit, before)
+
+    def autocomplete_participants(self, role, prefix, limit=10):
+        """Return names of students or tutors starting with prefix (case-insensitive)."""
+        table = PARTICIPANT_TABLES[role]
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            # A half-open range on the NOCASE name index instead of LIKE, so the
+            # lookup is an index seek regardless of wildcard characters in prefix.
+            cursor.execute(f"""
+                SELECT name FROM {table}
+                WHERE name >= ? AND name < ?
+                ORDER BY name LIMIT ?
+            """, (prefix, prefix + "\U0010ffff", int(limit)))
+            return [row[0] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"Error autocompleting {table}: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def autocomplete_students(self, prefix, limit=10):
+        """Return student names starting with prefix."""
+        return self.autocomplete_participants("student", prefix, limit)
+
+    def autocomplete_tutors(self, prefix, limit=10):
+        """Return tutor names starting with prefix."""
+        return self.autocomplete_participants("tutor", prefix, limit)
+
+    def archive_path(self, year):
+        """Return the path of the archive database holding meetings from year."""
+        return os.path.join(self.archive_dir, f"meetings_{year}.db")
+
+    def archive_years(self):
+        """Return the years that have an archive database, in ascending order."""
+        if not os.path.isdir(self.archive_dir):
+            return []
+        pattern = re.compile(r"^meetings_(\d{4})\.db$")
+        years = [int(match.group(1)) for match in map(pattern.match, os.listdir(self.archive_dir)) if match]
+        return sorted(years)
+
+    def archive_meetings(self, cutoff_date=None, vacuum=True):
+        """Move meetings dated before cutoff_date into per-year archive databases.
+
+        The cutoff defaults to 1 January of the oldest year kept hot, per the
+        ``keep_years`` setting in the ARCHIVE config section. Each year is copied
+        and removed from the hot database in one transaction spanning both files.
+        Returns the number of meetings archived.
+        """
+        if cutoff_date is None:
+            cutoff_date = f"{Date.today().year - archive_keep_years + 1}-01-01"
+        if not self.validate_date(cutoff_date):
+            raise ValueError(f"Invalid cutoff date: {cutoff_date}. Expected format: YYYY-MM-DD.")
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        archived = 0
+        try:
+            cursor.execute("SELECT DISTINCT substr(date, 1, 4) FROM meetings WHERE date < ?", (cutoff_date,))
+            years = sorted(int(row[0]) for row in cursor.fetchall())
+            for year in years:
+                # Meetings in [start, end) belong to this year's archive
+                start, end = f"{year:04d}-01-01", min(cutoff_date, f"{year + 1:04d}-01-01")
+                cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path(year),))
+                try:
+                    self.initialize_archive(cursor, "archive")
+                    cursor.execute(f"""
+                        INSERT INTO archive.meetings ({ARCHIVE_COLUMNS})
+                        SELECT {ARCHIVE_COLUMNS} FROM main.meetings WHERE date >= ? AND date < ?
+                    """, (start, end))
+                    first_change = change_feed.latest_token(cursor) + 1
+                    cursor.execute("DELETE FROM main.meetings WHERE date >= ? AND date < ?", (start, end))
+                    count = cursor.rowcount
+                    # Let sync consumers tell archived rows apart from deleted ones
+                    cursor.execute("""
+                        UPDATE meeting_changes SET operation = 'archive'
+                        WHERE id >= ? AND operation = 'delete' AND entity = 'meeting'
+                    """, (first_change,))
+                    conn.commit()
+                    archived += count
+                    logger.info(f"Archived {count} meetings from {year} to {self.archive_path(year)}.")
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
+                finally:
+                    cursor.execute("DETACH DATABASE archive")
+            if archived and vacuum:
+                cursor.execute("VACUUM")
+            return archived
+        except sqlite3.Error as e:
+            logger.error(f"Error archiving meetings: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def unarchive_meetings(self, meeting_ids):
+        """Move archived meetings with the given ids back into the hot database.
+
+        Only ids missing from the hot database are looked up, so the archives
+        are not attached when every meeting is already hot. Restored rows
+        keep their ids and are recorded as inserts in the change log; a later
+        archive_meetings run moves them out again. Returns the number restored.
+        """
+        meeting_ids = list(dict.fromkeys(meeting_ids))
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        restored = 0
+        try:
+            hot = set(self.select_meeting_ids(cursor, meeting_ids))
+            missing = [meeting_id for meeting_id in meeting_ids if meeting_id not in hot]
+            years = self.archive_years() if missing else []
+            for year in years:
+                cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path(year),))
+                try:
+                    for i in range(0, len(missing), ID_BATCH_SIZE):
+                        batch = missing[i:i + ID_BATCH_SIZE]
+                        placeholders = ", ".join("?" * len(batch))
+                        cursor.execute(f"""
+                            INSERT INTO main.meetings ({ARCHIVE_COLUMNS})
+                            SELECT {ARCHIVE_COLUMNS} FROM archive.meetings WHERE id IN ({placeholders})
+                        """, batch)
+                        restored += cursor.rowcount
+                        cursor.execute(f"DELETE FROM archive.meetings WHERE id IN ({placeholders})", batch)
+                    conn.commit()
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
+                finally:
+                    cursor.execute("DETACH DATABASE archive")
+            if restored:
+                logger.info(f"Restored {restored} archived meetings to the hot database.")
+            return restored
+        except sqlite3.Error as e:
+            logger.error(f"Error restoring archived meetings: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def archive_in_thread(self, cutoff_date=None):
+        """Run archive_meetings in a daemon thread, logging rather than raising errors."""
+        def archive():
+            try:
+                self.archive_meetings(cutoff_date)
+            except sqlite3.Error:
+                pass  # Already logged; try again next start
+            except OSError as e:
+                logger.error(f"Error archiving meetings: {e}")
+
+        thread = threading.Thread(target=archive, name="meeting-archiver", daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def initialize_archive(cursor, schema):
+        """Create the meetings table and its date index in an attached archive database."""
+        cursor.executescript(f"""
+            CREATE TABLE IF NOT EXISTS {schema}.meetings (
+                id INTEGER PRIMARY KEY,
+                date TEXT NOT NULL,
+                time TEXT NOT NULL,
+                topics TEXT NOT NULL,
+                referrals TEXT,
+                duration INTEGER NOT NULL DEFAULT 60,
+                tutor TEXT,
+                student TEXT,
+                tutor_id INTEGER,
+                student_id INTEGER,
+                created_at TEXT,
+                updated_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS {schema}.idx_meetings_date ON meetings (date, time);
+        """)
+        MeetingManager.initialize_timeline_indexes(cursor, schema)
+        # Archives written before meetings were timestamped lack these columns
+        cursor.execute(f"PRAGMA {schema}.table_info(meetings)")
+        existing = {row[1] for row in cursor.fetchall()}
+        for column in ("created_at", "updated_at"):
+            if column not in existing:
+                cursor.execute(f"ALTER TABLE {schema}.meetings ADD COLUMN {column} TEXT")
+
+    def get_meetings_in_range(self, start_date, end_date, include_recurring=True):
+        """Retrieve meetings dated between start_date and end_date inclusive.
+
+        Archive databases for years inside the range are attached one at a
+        time, so ranges within the hot period never touch the archives.
+        Occurrences of recurring series in the range are merged in unless
+        include_recurring is False.
+        """
+        if not (self.validate_date(start_date) and self.validate_date(end_date)):
+            raise ValueError(f"Invalid date range: {start_date} to {end_date}. Expected format: YYYY-MM-DD.")
+
+        start_year, end_year = int(start_date[:4]), int(end_date[:4])
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            meetings = []
+            for year in self.archive_years():
+                if not start_year <= year <= end_year:
+                    continue
+                cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path(year),))
+                try:
+                    cursor.execute(f"""
+                        SELECT {MEETING_COLUMNS} FROM archive.meetings
+                        WHERE date BETWEEN ? AND ?
+                    """, (start_date, end_date))
+                    meetings.extend(cursor.fetchall())
+                finally:
+                    cursor.execute("DETACH DATABASE archive")
+            cursor.execute(f"""
+                SELECT {MEETING_COLUMNS} FROM main.meetings
+                WHERE date BETWEEN ? AND ?
+            """, (start_date, end_date))
+            meetings.extend(cursor.fetchall())
+            meetings.sort(key=lambda meeting: (meeting[1], meeting[2], meeting[0]))
+            if include_recurring:
+                meetings = list(heapq.merge(meetings, self.expand_occurrences(start_date, end_date),
+                                            key=lambda meeting: (meeting[1], meeting[2])))
+            logger.info(f"Retrieved {len(meetings)} meetings between {start_date} and {end_date}.")
+            return meetings
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving meetings in range: {e}")
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def word_similarity(query, text):
+        """Score how well every word of query matches some word of text, from 0 to 1."""
+        query_words = query.lower().split()
+        text_words = (text or "").lower().split()
+        if not query_words or not text_words:
+            return 0.0
+        return sum(
+            max(SequenceMatcher(None, query_word, text_word).ratio() for text_word in text_words)
+            for query_word in query_words
+        ) / len(query_words)
+
+    def fuzzy_search_meetings(self, query, limit=20, min_similarity=0.6, candidates=200, include_archived=False):
+        """Search topics and referrals tolerating typos, best matches first.
+
+        Meetings sharing any trigram with the query are fetched from the FTS5
+        trigram index, best bm25 rank first, and only those candidates are
+        re-scored by word similarity. Queries shorter than a trigram fall
+        back to search_meetings. Archives have no trigram index; when
+        include_archived is True each one is scanned for rows containing any
+        of the query's trigrams, up to candidates rows per archive.
+        """
+        words = query.lower().split()
+        trigrams = {word[i:i + 3] for word in words for i in range(len(word) - 2)}
+        if not trigrams:
+            return self.search_meetings(query, include_archived)[:limit]
+
+        match = " OR ".join('"' + trigram.replace('"', '""') + '"' for trigram in sorted(trigrams))
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT m.id, m.date, m.time, m.topics, m.referrals, m.duration, m.tutor, m.student
+                FROM meetings_trigram AS t
+                JOIN meetings AS m ON m.id = t.rowid
+                WHERE meetings_trigram MATCH ?
+                ORDER BY t.rank
+                LIMIT ?
+            """, (match, int(candidates)))
+            found = cursor.fetchall()
+            if include_archived:
+                patterns = [f"%{trigram}%" for trigram in sorted(trigrams)]
+                conditions = " OR ".join("topics LIKE ? OR referrals LIKE ?" for _ in patterns)
+                params = [pattern for pattern in patterns for _ in range(2)] + [int(candidates)]
+                for year in self.archive_years():
+                    cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path(year),))
+                    try:
+                        cursor.execute(f"SELECT {MEETING_COLUMNS} FROM archive.meetings WHERE {conditions} LIMIT ?", params)
+                        found.extend(cursor.fetchall())
+                    finally:
+                        cursor.execute("DETACH DATABASE archive")
+            scored = []
+            for meeting in found:
+                similarity = max(self.word_similarity(query, meeting[3]), self.word_similarity(query, meeting[4]))
+                if similarity >= min_similarity:
+                    scored.append((similarity, meeting))
+            scored.sort(key=lambda item: item[0], reverse=True)
+            meetings = [meeting for _, meeting in scored[:limit]]
+            logger.info(f"Found {len(meetings)} meetings fuzzily matching '{query}'.")
+            return meetings
+        except sqlite3.Error as e:
+            logger.error(f"Error fuzzy searching meetings: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def changes_since(self, token=0, limit=500):
+        """Return meeting changes recorded after token and the token to resume from.
+
+        See change_feed.changes_since for the shape of each change.
+        """
+        conn = self.connect_db()
+        try:
+            return change_feed.changes_since(conn, token, limit)
+        except sqlite3.Error as e:
+            logger.error(f"Error reading meeting changes: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def latest_change_token(self):
+        """Return the token of the most recent meeting change."""
+        conn = self.connect_db()
+        try:
+            return change_feed.latest_token(conn.cursor())
+        except sqlite3.Error as e:
+            logger.error(f"Error reading meeting changes: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def search_meetings(self, keyword, include_archived=False):
+        """Search meetings by keyword in topics or referrals.
+
+        Only the hot database is searched unless include_archived is True, in
+        which case every archive database is attached and searched in turn.
+        """
+        query = f"""
+            SELECT {MEETING_COLUMNS} FROM {{schema}}.meetings
+            WHERE topics LIKE ? OR referrals LIKE ?
+        """
+        params = (f"%{keyword}%", f"%{keyword}%")
+        conn = self.connect_db()
+        cursor = conn.cursor()
+        try:
+            meetings = []
+            if include_archived:
+                for year in self.archive_years():
+                    cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path(year),))
+                    try:
+                        cursor.execute(query.format(schema="archive"), params)
+                        meetings.extend(cursor.fetchall())
+                    finally:
+                        cursor.execute("DETACH DATABASE archive")
+            cursor.execute(query.format(schema="main"), params)
+            meetings.extend(cursor.fetchall())
             logger.info(f"Found {len(meetings)} meetings matching '{keyword}'.")
             return meetings
         except sqlite3.Error as e:
             logger.error(f"Error searching meetings: {e}")
             raise
         finally:
-            conn.close()
\ No newline at end of file
+            conn.close()
+
+def main(argv=None):
+    """Command line entry point: python -m modules.meeting_manager archive [--cutoff DATE]."""
+    parser = argparse.ArgumentParser(description="Maintain the meetings database.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    archive_parser = subparsers.add_parser("archive", help="Move old meetings into per-year archive databases.")
+    archive_parser.add_argument("--cutoff", help="Archive meetings dated before this day (default: per keep_years).")
+
+    args = parser.parse_args(argv)
+    if args.command == "archive":
+        archived = MeetingManager().archive_meetings(args.cutoff)
+        print(f"Archived {archived} meeting(s).")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+import asyncio
+import heapq
+import sqlite3
+import threading
+from configparser import ConfigParser
+from datetime import datetime, timedelta
+from modules.logger import logger
+from modules.meeting_manager import MEETING_COLUMNS
+
+# Load configuration
+config = ConfigParser()
+config.read("config/config.ini")
+reminder_lead_minutes = config.getint("REMINDERS", "lead_minutes", fallback=15)
+reminder_window_hours = config.getint("REMINDERS", "window_hours", fallback=24)
+reminder_refresh_seconds = config.getint("REMINDERS", "refresh_seconds", fallback=60)
+reminder_file = config.get("REMINDERS", "reminder_file", fallback="logs/reminders.log")
+
+def meeting_start(meeting):
+    """Return the start of a meeting row as a datetime."""
+    return datetime.strptime(f"{meeting[1]} {meeting[2]}", "%Y-%m-%d %H:%M")
+
+def format_reminder(meeting, starts_at):
+    """Return the text of a reminder for a meeting."""
+    details = f"{meeting[3]}"
+    if meeting[7]:
+        details += f" with {meeting[7]}"
+    if meeting[6]:
+        details += f" (tutor: {meeting[6]})"
+    return f"Upcoming meeting at {starts_at:%Y-%m-%d %H:%M}: {details}"
+
+class ReminderSink:
+    """Destination for reminders. Subclasses implement deliver."""
+
+    def deliver(self, meeting, starts_at):
+        raise NotImplementedError
+
+class LogSink(ReminderSink):
+    """Write reminders to the application log."""
+
+    def deliver(self, meeting, starts_at):
+        logger.info(format_reminder(meeting, starts_at))
+
+class FileSink(ReminderSink):
+    """Append reminders to a local file, one per line."""
+
+    def __init__(self, path=None):
+        self.path = path or reminder_file
+
+    def deliver(self, meeting, starts_at):
+        with open(self.path, "a") as f:
+            f.write(format_reminder(meeting, starts_at) + "\n")
+
+class CallbackSink(ReminderSink):
+    """Pass reminders to a callable, e.g. a GUI popup."""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def deliver(self, meeting, starts_at):
+        self.callback(format_reminder(meeting, starts_at))
+
+class ReminderService:
+    """Deliver reminders for upcoming meetings from a heap of due times.
+
+    Only meetings starting within the next ``window_hours`` are loaded, via
+    MeetingManager.get_meetings_in_range (a date-index range scan that also
+    expands recurring series). Meetings starting up to ``lead_minutes`` past
+    the window end are loaded too, so their reminders fall due inside the
+    window rather than at the next reload. The service sleeps until the
+    earliest due reminder, reloads when the window is exhausted, and picks up
+    new, moved or removed meetings and series from the change feed instead
+    of rereading the tables. A changed series has its window's occurrences
+    re-expanded.
+    """
+
+    def __init__(self, meeting_manager, sinks=None, lead_minutes=None, window_hours=None,
+                 refresh_seconds=None, clock=datetime.now):
+        self.meeting_manager = meeting_manager
+        self.sinks = sinks if sinks is not None else [LogSink()]
+        self.lead = timedelta(minutes=reminder_lead_minutes if lead_minutes is None else lead_minutes)
+        self.window = timedelta(hours=reminder_window_hours if window_hours is None else window_hours)
+        self.refresh_seconds = reminder_refresh_seconds if refresh_seconds is None else refresh_seconds
+        self.clock = clock
+
+        self._heap = []  # (due, key) entries; stale ones are skipped on pop
+        self._scheduled = {}  # key -> (due, meeting) for reminders still pending
+        self._delivered = {}  # key -> start already reminded, kept until the meeting starts
+        self._window_end = None
+        self._token = 0
+        self._loop = None
+        self._wake = None
+        self._stopping = False
+
+    @staticmethod
+    def meeting_key(meeting):
+        """Identify a stored meeting by id, or a recurring occurrence by series and date."""
+        if isinstance(meeting[0], int):
+            return str(meeting[0])
+        return f"{meeting[0]}@{meeting[1]}"
+
+    def horizon(self):
+        """Return the latest start (exclusive) whose reminder falls due inside the window."""
+        return self._window_end + self.lead
+
+    def schedule(self, meeting, now):
+        """Queue a reminder for meeting if it falls due inside the loaded window."""
+        starts_at = meeting_start(meeting)
+        key = self.meeting_key(meeting)
+        if self._delivered.get(key) == starts_at or not now <= starts_at < self.horizon():
+            return
+        due = starts_at - self.lead
+        self._scheduled[key] = (due, meeting)
+        heapq.heappush(self._heap, (due, key))
+
+    def unschedule(self, meeting_id):
+        """Drop the pending reminder for a stored meeting id, if any."""
+        self._scheduled.pop(str(meeting_id), None)
+
+    def load_window(self, now=None):
+        """Load the meetings whose reminders fall due between now and the end of the next window."""
+        now = now or self.clock()
+        window_end = now + self.window
+        # Changes up to here are already reflected in the rows loaded below
+        token = self.meeting_manager.latest_change_token()
+        meetings = self.meeting_manager.get_meetings_in_range(
+            now.strftime("%Y-%m-%d"), (window_end + self.lead).strftime("%Y-%m-%d")
+        )
+
+        self._token = token
+        self._heap = []
+        self._scheduled = {}
+        # Meetings past the previous window end may already have been reminded
+        self._delivered = {key: starts_at for key, starts_at in self._delivered.items() if starts_at >= now}
+        self._window_end = window_end
+        for meeting in meetings:
+            self.schedule(meeting, now)
+        logger.info(f"Loaded {len(self._scheduled)} reminders due up to {self._window_end:%Y-%m-%d %H:%M}.")
+
+    def reload_series(self, now):
+        """Reschedule the recurring occurrences in the loaded window."""
+        occurrences = list(self.meeting_manager.expand_occurrences(
+            now.strftime("%Y-%m-%d"), self.horizon().strftime("%Y-%m-%d")
+        ))
+
+        for key in [key for key in self._scheduled if key.startswith("S")]:
+            del self._scheduled[key]
+        for meeting in occurrences:
+            self.schedule(meeting, now)
+        logger.info(f"Reloaded {len(occurrences)} recurring meeting occurrences.")
+
+    def refresh(self, now=None):
+        """Apply meetings and series added, changed or removed since the last load or refresh."""
+        now = now or self.clock()
+        applied = 0
+        series_changed = False
+        while True:
+            changes, self._token = self.meeting_manager.changes_since(self._token)
+            for _, operation, meeting_id, _, meeting in changes:
+                if operation == "restore":
+                    # Database rolled back to a snapshot; pending reminders may be stale
+                    self.load_window(now)
+                    return
+                if str(meeting_id).startswith("S"):
+                    series_changed = True
+                    applied += 1
+                    continue
+                self.unschedule(meeting_id)
+                if meeting is not None and operation in ("insert", "update"):
+                    self.schedule(tuple(meeting[column] for column in MEETING_COLUMNS.split(", ")), now)
+                applied += 1
+            if not changes:
+                break
+        if applied:
+            logger.info(f"Applied {applied} meeting changes to pending reminders.")
+        if series_changed:
+            self.reload_series(now)
+
+    def deliver_due(self, now=None):
+        """Deliver every reminder due at or before now. Returns the number delivered."""
+        now = now or self.clock()
+        delivered = 0
+        while self._heap and self._heap[0][0] <= now:
+            due, key = heapq.heappop(self._heap)
+            entry = self._scheduled.get(key)
+            if entry is None or entry[0] != due:
+                continue  # Meeting was removed or rescheduled
+            del self._scheduled[key]
+            meeting = entry[1]
+            self._delivered[key] = meeting_start(meeting)
+            for sink in self.sinks:
+                try:
+                    sink.deliver(meeting, meeting_start(meeting))
+                except Exception as e:
+                    logger.error(f"Reminder sink {type(sink).__name__} failed: {e}")
+            delivered += 1
+        return delivered
+
+    def next_due(self):
+        """Return when the earliest pending reminder is due, or None."""
+        while self._heap and self._scheduled.get(self._heap[0][1], (None,))[0] != self._heap[0][0]:
+            heapq.heappop(self._heap)  # Discard stale entries
+        return self._heap[0][0] if self._heap else None
+
+    async def run(self):
+        """Deliver reminders until stop is called.
+
+        Database errors are logged and the load or refresh is retried on the
+        next tick, so a locked or briefly unavailable database does not end
+        the service.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        while not self._stopping:
+            now = self.clock()
+            if self._window_end is None or now >= self._window_end:
+                try:
+                    self.load_window(now)
+                except sqlite3.Error as e:
+                    logger.error(f"Error loading reminders, retrying: {e}")
+            self.deliver_due(now)
+
+            # Sleep until the next reminder, the window end or the next change-feed check
+            wake_at = min(filter(None, (self.next_due(), self._window_end)), default=None)
+            timeout = self.refresh_seconds
+            if wake_at is not None:
+                timeout = min(max((wake_at - self.clock()).total_seconds(), 0), timeout)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if self._window_end is not None:
+                try:
+                    self.refresh()
+                except sqlite3.Error as e:
+                    logger.error(f"Error refreshing reminders, retrying: {e}")
+
+    def notify(self):
+        """Wake the service to pick up new meetings now. Safe to call from any thread."""
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    def stop(self):
+        """Ask the service to stop. Safe to call from any thread."""
+        self._stopping = True
+        self.notify()
+
+    def start_in_thread(self):
+        """Run the service on its own event loop in a daemon thread."""
+        thread = threading.Thread(target=asyncio.run, args=(self.run(),), name="reminder-service", daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,97 @@
+import unittest
+import os
+import shutil
+import sqlite3
+from modules import change_feed
+from modules.backup import backup_database, restore_database, list_snapshots, rotate_snapshots, BackupScheduler
+
+# Test database and backup directory paths
+TEST_DB_FILE = "database/test_backup_source.db"
+TEST_BACKUP_DIR = "database/test_backups"
+
+class TestBackup(unittest.TestCase):
+    def setUp(self):
+        """Create a small source database before each test."""
+        os.makedirs(os.path.dirname(TEST_DB_FILE), exist_ok=True)
+        conn = sqlite3.connect(TEST_DB_FILE)
+        conn.execute("CREATE TABLE meetings (id INTEGER PRIMARY KEY, topics TEXT)")
+        conn.executemany("INSERT INTO meetings (topics) VALUES (?)", [(f"Topic {i}" * 50,) for i in range(500)])
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        """Remove the source database and snapshots after each test."""
+        if os.path.exists(TEST_DB_FILE):
+            os.remove(TEST_DB_FILE)
+        shutil.rmtree(TEST_BACKUP_DIR, ignore_errors=True)
+
+    def count_meetings(self):
+        conn = sqlite3.connect(TEST_DB_FILE)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_backup_and_restore(self):
+        """Test that a snapshot restores the database as it was."""
+        snapshot_path, elapsed = backup_database(TEST_DB_FILE, TEST_BACKUP_DIR, pages=4)
+        self.assertTrue(os.path.exists(snapshot_path), "Snapshot file should be created")
+        self.assertTrue(snapshot_path.endswith(".db.gz"), "Snapshot should be compressed")
+        self.assertGreaterEqual(elapsed, 0, "Elapsed time should be measured")
+
+        conn = sqlite3.connect(TEST_DB_FILE)
+        conn.execute("DELETE FROM meetings")
+        conn.commit()
+        conn.close()
+
+        restore_database(snapshot_path, TEST_DB_FILE)
+        self.assertEqual(self.count_meetings(), 500, "Restored database should hold the snapshot's rows")
+
+    def test_rotate_snapshots(self):
+        """Test that only the newest snapshots are kept."""
+        for _ in range(3):
+            backup_database(TEST_DB_FILE, TEST_BACKUP_DIR, keep=2)
+
+        snapshots = list_snapshots(TEST_DB_FILE, TEST_BACKUP_DIR)
+        self.assertEqual(len(snapshots), 2, "Backups beyond the limit should be rotated out")
+
+        removed = rotate_snapshots(TEST_DB_FILE, keep=1, directory=TEST_BACKUP_DIR)
+        self.assertEqual(removed, snapshots[1:], "The oldest snapshot should be removed")
+
+    def test_backup_missing_database(self):
+        """Test that backing up a missing database raises an error."""
+        with self.assertRaises(sqlite3.Error):
+            backup_database("database/does_not_exist.db", TEST_BACKUP_DIR)
+
+    def test_scheduler_start_stop(self):
+        """Test that the scheduler thread starts and stops cleanly."""
+        scheduler = BackupScheduler([TEST_DB_FILE], interval_minutes=60, directory=TEST_BACKUP_DIR)
+        scheduler.start()
+        self.assertTrue(scheduler._thread.is_alive(), "Scheduler thread should be running")
+        scheduler.stop()
+        self.assertIsNone(scheduler._thread, "Scheduler thread should be stopped")
+        self.assertEqual(len(list_snapshots(TEST_DB_FILE, TEST_BACKUP_DIR)), 1, "A snapshot should be taken when the scheduler starts")
+
+    def test_restore_keeps_change_tokens_increasing(self):
+        """Test that restoring a database with a change log writes a marker after the old tokens."""
+        conn = sqlite3.connect(TEST_DB_FILE)
+        change_feed.initialize_change_log(conn.cursor())
+        conn.commit()
+        conn.close()
+        snapshot_path, _ = backup_database(TEST_DB_FILE, TEST_BACKUP_DIR)
+
+        conn = sqlite3.connect(TEST_DB_FILE)
+        conn.execute("INSERT INTO meetings (topics) VALUES ('After Snapshot')")
+        conn.commit()
+        token = change_feed.latest_token(conn.cursor())
+        conn.close()
+
+        restore_database(snapshot_path, TEST_DB_FILE)
+        conn = sqlite3.connect(TEST_DB_FILE)
+        changes, _ = change_feed.changes_since(conn, token - 1)
+        conn.close()
+        self.assertEqual([(operation, meeting_id) for _, operation, meeting_id, _, _ in changes], [("restore", 0)], "Consumers should see a restore marker")
+        self.assertGreater(changes[0][0], token, "Marker token should follow the pre-restore tokens")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -1,12 +1,14 @@
 import unittest
 import sqlite3
 import os
-from modules.meeting_manager import MeetingManager
+import shutil
+from modules.meeting_manager import MeetingManager, CONFLICT_SQL, MEETING_COLUMNS
 from modules.logger import logger
 
 # Test database and log file paths
 TEST_DB_FILE = "database/test_meetings.db"
 TEST_LOG_FILE = "logs/test.log"
+TEST_ARCHIVE_DIR = "database/test_archive"
 
 class TestMeetingManager(unittest.TestCase):
     @classmethod
@@ -23,6 +25,7 @@ class TestMeetingManager(unittest.TestCase):
         # Initialize the database
         cls.manager = MeetingManager()
         cls.manager.connect_db = lambda: sqlite3.connect(TEST_DB_FILE)
+        cls.manager.archive_dir = TEST_ARCHIVE_DIR
         cls.manager.initialize_db()
 
     @classmethod
@@ -32,14 +35,20 @@ class TestMeetingManager(unittest.TestCase):
             os.remove(TEST_DB_FILE)
         if os.path.exists(TEST_LOG_FILE):
             os.remove(TEST_LOG_FILE)
+        shutil.rmtree(TEST_ARCHIVE_DIR, ignore_errors=True)
 
     def setUp(self):
         """Clear the database before each test."""
         conn = sqlite3.connect(TEST_DB_FILE)
         cursor = conn.cursor()
         cursor.execute("DELETE FROM meetings")
+        cursor.execute("DELETE FROM meeting_series_exceptions")
+        cursor.execute("DELETE FROM meeting_series")
+        cursor.execute("DELETE FROM students")
+        cursor.execute("DELETE FROM tutors")
         conn.commit()
         conn.close()
+        shutil.rmtree(TEST_ARCHIVE_DIR, ignore_errors=True)
 
     def test_validate_date(self):
         """Test the date validation function."""
@@ -73,5 +82,381 @@ class TestMeetingManager(unittest.TestCase):
         meetings = self.manager.search_meetings("Test Topics 1")
         self.assertEqual(len(meetings), 1, "There should be 1 meeting matching the keyword")
 
+    def test_add_meeting_invalid_duration(self):
+        """Test that a non-positive duration is rejected."""
+        success, message = self.manager.add_meeting("2023-10-01", "14:30", "Test Topics", duration=0)
+        self.assertFalse(success, "Zero duration should return False")
+        self.assertEqual(message, "Invalid duration: 0. Expected a positive number of minutes.", "Error message should match")
+
+    def test_find_conflicts(self):
+        """Test detecting overlapping meetings for the same tutor or student."""
+        self.manager.add_meeting("2023-10-01", "14:00", "Test Topics 1", duration=60, tutor="Tutor A", student="Student A")
+        self.manager.add_meeting("2023-10-01", "16:00", "Test Topics 2", duration=30, tutor="Tutor A", student="Student B")
+
+        conflicts = self.manager.find_conflicts("2023-10-01", "14:30", 60, tutor="Tutor A")
+        self.assertEqual(len(conflicts), 1, "Only the overlapping meeting should conflict")
+        self.assertEqual(conflicts[0][3], "Test Topics 1", "Conflicting meeting should match")
+
+        conflicts = self.manager.find_conflicts("2023-10-01", "15:00", 60, tutor="Tutor A")
+        self.assertEqual(len(conflicts), 0, "Back-to-back meetings should not conflict")
+
+        conflicts = self.manager.find_conflicts("2023-10-01", "16:15", 30, tutor="Tutor B", student="Student B")
+        self.assertEqual(len(conflicts), 1, "A double-booked student should conflict")
+
+        conflicts = self.manager.find_conflicts("2023-10-01", "14:30", 60, tutor="Tutor B")
+        self.assertEqual(len(conflicts), 0, "Meetings with other participants should not conflict")
+
+        conflicts = self.manager.find_conflicts("2023-10-01", "14:30", 60, tutor="tutor a")
+        self.assertEqual(len(conflicts), 1, "Tutor names should match case-insensitively")
+
+    def test_find_conflicts_query_plan(self):
+        """Test that conflict candidates come from the interval index, not a participant's history."""
+        conn = self.manager.connect_db()
+        plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + CONFLICT_SQL, ("2023-10-01", "14:00", 60, "2023-10-01", "14:00", 1, 1, None))]
+        conn.close()
+        self.assertTrue(plan[0].startswith("SCAN mi VIRTUAL TABLE INDEX 2:"), f"R*Tree range should drive the query: {plan}")
+        self.assertTrue(all("timeline" not in step for step in plan), f"Timeline indexes should not be used: {plan}")
+
+    def test_find_series_conflicts_with_recurring(self):
+        """Test that a new series is checked against the occurrences of existing series."""
+        self.manager.add_recurring_meeting("2023-10-16", "10:30", "Weekly Tutorial", tutor="Tutor A", end_date="2023-10-16")
+
+        conflicts = self.manager.find_series_conflicts("2023-10-02", "10:00", 60, tutor="Tutor A", frequency="fortnightly")
+        self.assertEqual([(meeting[0][0], meeting[1]) for meeting in conflicts], [("S", "2023-10-16")], "Overlapping occurrence should conflict")
+
+        conflicts = self.manager.find_series_conflicts("2023-10-09", "10:00", 60, tutor="Tutor A", frequency="fortnightly")
+        self.assertEqual(conflicts, [], "Series on other weeks should not conflict")
+
+    def test_add_meeting_reject_conflicts(self):
+        """Test that conflicting meetings can be rejected on insert."""
+        self.manager.add_meeting("2023-10-01", "14:00", "Test Topics 1", duration=60, tutor="Tutor A")
+
+        success, message = self.manager.add_meeting("2023-10-01", "14:30", "Test Topics 2", tutor="Tutor A", reject_conflicts=True)
+        self.assertFalse(success, "Conflicting meeting should be rejected")
+        self.assertTrue(message.startswith("Scheduling conflict"), "Error message should report the conflict")
+
+        success, message = self.manager.add_meeting("2023-10-01", "14:30", "Test Topics 2", tutor="Tutor A")
+        self.assertTrue(success, "Conflicting meeting should be added when not rejecting")
+
+    def test_get_student_history(self):
+        """Test paging through a student's meetings, newest first."""
+        self.manager.add_meeting("2023-10-01", "14:30", "Test Topics 1", student="Student A")
+        self.manager.add_meeting("2023-10-02", "15:30", "Test Topics 2", student="Student A")
+        self.manager.add_meeting("2023-10-03", "16:30", "Test Topics 3", student="Student A")
+        self.manager.add_meeting("2023-10-02", "09:00", "Other Topics", student="Student B")
+
+        page = self.manager.get_student_history("Student A", limit=2)
+        self.assertEqual([meeting[3] for meeting in page], ["Test Topics 3", "Test Topics 2"], "First page should hold the newest meetings")
+
+        last = page[-1]
+        page = self.manager.get_student_history("Student A", limit=2, before=(last[1], last[2], last[0]))
+        self.assertEqual([meeting[3] for meeting in page], ["Test Topics 1"], "Second page should continue after the first")
+
+        self.assertEqual(self.manager.get_student_history("Unknown Student"), [], "Unknown students should have no history")
+
+    def test_history_query_plan(self):
+        """Test that history pages are read from the covering timeline index without a sort."""
+        conn = self.manager.connect_db()
+        plan = [row[3] for row in conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT {MEETING_COLUMNS} FROM meetings WHERE student_id = ? "
+            "AND (date, time, id) < (?, ?, ?) ORDER BY date DESC, time DESC, id DESC LIMIT ?",
+            (1, "2023-10-01", "14:00", 1, 20),
+        )]
+        conn.close()
+        self.assertIn("USING COVERING INDEX idx_meetings_student_timeline", plan[0], f"History should not touch the table: {plan}")
+        self.assertTrue(all("TEMP B-TREE" not in step for step in plan), f"History should not need a sort: {plan}")
+
+    def test_get_tutor_history(self):
+        """Test retrieving a tutor's meetings."""
+        self.manager.add_meeting("2023-10-01", "14:30", "Test Topics 1", tutor="Tutor A")
+        self.manager.add_meeting("2023-10-02", "15:30", "Test Topics 2", tutor="Tutor B")
+
+        meetings = self.manager.get_tutor_history("tutor a")
+        self.assertEqual(len(meetings), 1, "Tutor names should match case-insensitively")
+
+    def test_autocomplete_students(self):
+        """Test prefix autocomplete of student names."""
+        self.manager.add_meeting("2023-10-01", "14:30", "Test Topics 1", student="Alice")
+        self.manager.add_meeting("2023-10-02", "15:30", "Test Topics 2", student="Alfred")
+        self.manager.add_meeting("2023-10-03", "16:30", "Test Topics 3", student="Bob")
+        self.manager.add_meeting("2023-10-04", "16:30", "Test Topics 4", student="alice")
+
+        self.assertEqual(self.manager.autocomplete_students("al"), ["Alfred", "Alice"], "Matching names should be returned once, sorted")
+        self.assertEqual(self.manager.autocomplete_students("Bo"), ["Bob"], "Prefix should match")
+        self.assertEqual(self.manager.autocomplete_students("Z"), [], "No names should match")
+
+    def test_archive_meetings(self):
+        """Test moving old meetings into per-year archive databases."""
+        self.manager.add_meeting("2021-05-01", "14:30", "Test Topics 1")
+        self.manager.add_meeting("2022-06-01", "15:30", "Test Topics 2")
+        self.manager.add_meeting("2023-10-01", "16:30", "Test Topics 3")
+
+        archived = self.manager.archive_meetings("2023-01-01")
+        self.assertEqual(archived, 2, "Meetings before the cutoff should be archived")
+        self.assertEqual(self.manager.archive_years(), [2021, 2022], "One archive should exist per year")
+
+        conn = self.manager.connect_db()
+        topics = [row[0] for row in conn.execute("SELECT topics FROM meetings")]
+        conn.close()
+        self.assertEqual(topics, ["Test Topics 3"], "Only recent meetings should stay in the hot database")
+
+        self.assertEqual(self.manager.archive_meetings("2023-01-01"), 0, "Archiving again should move nothing")
+
+    def test_get_meetings_in_range(self):
+        """Test range queries spanning archived and hot meetings."""
+        self.manager.add_meeting("2021-05-01", "14:30", "Test Topics 1")
+        self.manager.add_meeting("2022-06-01", "15:30", "Test Topics 2")
+        self.manager.add_meeting("2023-10-01", "16:30", "Test Topics 3")
+        self.manager.archive_meetings("2023-01-01")
+
+        meetings = self.manager.get_meetings_in_range("2022-01-01", "2023-12-31")
+        self.assertEqual([meeting[3] for meeting in meetings], ["Test Topics 2", "Test Topics 3"], "Archived and hot meetings should be combined in date order")
+
+        meetings = self.manager.get_meetings_in_range("2021-05-02", "2022-05-31")
+        self.assertEqual(len(meetings), 0, "Meetings outside the range should be excluded")
+
+    def test_changes_since(self):
+        """Test that inserts, updates and deletes appear in the change feed."""
+        _, token = self.manager.changes_since(0, limit=1000000)
+
+        self.manager.add_meeting("2023-10-01", "14:30", "Test Topics 1")
+        conn = sqlite3.connect(TEST_DB_FILE)
+        conn.execute("UPDATE meetings SET topics = 'Updated Topics' WHERE topics = 'Test Topics 1'")
+        conn.commit()
+        meeting_id, created_at, updated_at = conn.execute("SELECT id, created_at, updated_at FROM meetings").fetchone()
+        conn.execute("DELETE FROM meetings")
+        conn.commit()
+        conn.close()
+
+        self.assertIsNotNone(created_at, "created_at should be set on insert")
+        self.assertIsNotNone(updated_at, "updated_at should be set on update")
+
+        changes, next_token = self.manager.changes_since(token)
+        self.assertEqual([change[1] for change in changes], ["insert", "update", "delete"], "Each write should be recorded once")
+        self.assertTrue(all(change[2] == meeting_id for change in changes), "Changes should reference the meeting")
+        self.assertEqual(next_token, changes[-1][0], "Next token should resume after the last change")
+
+        changes, _ = self.manager.changes_since(next_token)
+        self.assertEqual(changes, [], "No changes should follow the latest token")
+
+    def test_changes_since_archive(self):
+        """Test that archived meetings are reported as archived, not deleted."""
+        self.manager.add_meeting("2021-05-01", "14:30", "Test Topics 1")
+        _, token = self.manager.changes_since(0, limit=1000000)
+
+        self.manager.archive_meetings("2023-01-01")
+
+        changes, _ = self.manager.changes_since(token)
+        self.assertEqual([change[1] for change in changes], ["archive"], "Archiving should be recorded as archive")
+        self.assertIsNone(changes[0][4], "Archived meetings should no longer be returned")
+
+    def test_changes_since_series(self):
+        """Test that recurring series writes appear in the change feed."""
+        token = self.manager.latest_change_token()
+        self.manager.add_recurring_meeting("2023-10-02", "10:00", "Weekly Tutorial")
+        changes, _ = self.manager.changes_since(token)
+        series_id = int(changes[0][2][1:])
+
+        self.manager.skip_occurrence(series_id, "2023-10-09")
+        self.manager.end_series(series_id, "2023-12-31")
+        self.manager.delete_series(series_id)
+
+        changes, _ = self.manager.changes_since(token)
+        self.assertEqual([(change[1], change[2]) for change in changes], [("insert", f"S{series_id}"), ("update", f"S{series_id}"), ("update", f"S{series_id}"), ("delete", f"S{series_id}")], "Each series write should be recorded once")
+        self.assertTrue(all(change[4] is None for change in changes), "Deleted series should no longer be returned")
+
+        self.manager.add_recurring_meeting("2023-10-02", "10:00", "Weekly Tutorial")
+        changes, _ = self.manager.changes_since(changes[-1][0])
+        self.manager.skip_occurrence(int(changes[0][2][1:]), "2023-10-09")
+        changes, _ = self.manager.changes_since(changes[-1][0])
+        self.assertEqual(changes[0][4]["topics"], "Weekly Tutorial", "Series changes should carry the series row")
+        self.assertEqual(changes[0][4]["exceptions"], ["2023-10-09"], "Series changes should carry the skipped dates")
+
+    def test_fuzzy_search_meetings(self):
+        """Test typo-tolerant search over topics and referrals."""
+        self.manager.add_meeting("2023-10-01", "14:30", "Exam anxiety", "Wellbeing service")
+        self.manager.add_meeting("2023-10-02", "15:30", "Student finance", "Money advice")
+        self.manager.add_meeting("2023-10-03", "16:30", "Module choices")
+
+        meetings = self.manager.fuzzy_search_meetings("anxeity")
+        self.assertEqual([meeting[3] for meeting in meetings], ["Exam anxiety"], "Misspelled topic should match")
+
+        meetings = self.manager.fuzzy_search_meetings("finanse")
+        self.assertEqual([meeting[3] for meeting in meetings], ["Student finance"], "Misspelled topic should match")
+
+        meetings = self.manager.fuzzy_search_meetings("wellbeeing")
+        self.assertEqual([meeting[3] for meeting in meetings], ["Exam anxiety"], "Misspelled referral should match")
+
+        self.assertEqual(self.manager.fuzzy_search_meetings("astronomy"), [], "Unrelated words should not match")
+
+    def test_add_recurring_meeting(self):
+        """Test that a recurring series is stored once and expanded on read."""
+        success, message = self.manager.add_recurring_meeting("2023-10-02", "10:00", "Weekly Tutorial", end_date="2023-10-30")
+        self.assertTrue(success, "Recurring meeting should be added successfully")
+        self.assertEqual(message, "Recurring meeting added successfully!", "Success message should match")
+        self.assertEqual(len(self.manager.view_all_meetings()), 0, "Occurrences should not be stored as meetings")
+
+        occurrences = list(self.manager.expand_occurrences("2023-10-01", "2023-12-31"))
+        self.assertEqual([meeting[1] for meeting in occurrences], ["2023-10-02", "2023-10-09", "2023-10-16", "2023-10-23", "2023-10-30"], "Occurrences should stop at the end date")
+
+        success, message = self.manager.add_recurring_meeting("2023-10-02", "10:00", "Tutorial", frequency="daily")
+        self.assertFalse(success, "Unknown frequency should return False")
+
+    def test_expand_occurrences_window(self):
+        """Test fortnightly expansion inside a window with a skipped date."""
+        self.manager.add_recurring_meeting("2023-01-02", "09:00", "Fortnightly Check-in", frequency="fortnightly")
+        occurrences = list(self.manager.expand_occurrences("2023-10-01", "2023-10-31"))
+        self.assertEqual([meeting[1] for meeting in occurrences], ["2023-10-09", "2023-10-23"], "Occurrences should fall every two weeks")
+
+        series_id = int(occurrences[0][0][1:])
+        self.manager.skip_occurrence(series_id, "2023-10-23")
+
+        occurrences = list(self.manager.expand_occurrences("2023-10-01", "2023-10-31"))
+        self.assertEqual([meeting[1] for meeting in occurrences], ["2023-10-09"], "Skipped dates should be excluded")
+
+    def test_view_all_meetings_window(self):
+        """Test that windowed views merge stored meetings with occurrences in order."""
+        self.manager.add_recurring_meeting("2023-10-02", "10:00", "Weekly Tutorial")
+        self.manager.add_meeting("2023-10-05", "14:30", "Test Topics 1")
+        self.manager.add_meeting("2023-11-05", "14:30", "Test Topics 2")
+
+        meetings = self.manager.view_all_meetings("2023-10-01", "2023-10-10")
+        self.assertEqual([(meeting[1], meeting[3]) for meeting in meetings], [
+            ("2023-10-02", "Weekly Tutorial"),
+            ("2023-10-05", "Test Topics 1"),
+            ("2023-10-09", "Weekly Tutorial"),
+        ], "Stored meetings and occurrences should be merged by date")
+
+    def test_update_meeting(self):
+        """Test updating a single meeting and auditing the change."""
+        self.manager.add_meeting("2023-10-01", "14:30", "Test Topics 1", student="Student A")
+        meeting_id = self.manager.view_all_meetings()[0][0]
+
+        success, message = self.manager.update_meeting(meeting_id, time="15:00", student="Student B")
+        self.assertTrue(success, "Meeting should be updated successfully")
+        self.assertEqual(message, "Updated 1 meeting(s) successfully!", "Success message should match")
+
+        meeting = self.manager.get_meeting(meeting_id)
+        self.assertEqual((meeting[2], meeting[7]), ("15:00", "Student B"), "Updated fields should be stored")
+        self.assertEqual(len(self.manager.get_student_history("Student B")), 1, "Student link should follow the update")
+
+        conn = sqlite3.connect(TEST_DB_FILE)
+        operation, before, after = conn.execute("SELECT operation, before, after FROM meeting_audit WHERE meeting_id = ?", (meeting_id,)).fetchone()
+        conn.close()
+        self.assertEqual(operation, "update", "Audit should record the operation")
+        self.assertIn('"time": "14:30"', before, "Audit should hold the before image")
+        self.assertIn('"time": "15:00"', after, "Audit should hold the after image")
+
+        success, message = self.manager.update_meeting(meeting_id, time="25:00")
+        self.assertFalse(success, "Invalid time should return False")
+        self.assertEqual(message, "Invalid time format: 25:00. Expected format: HH:MM.", "Error message should match")
+
+    def test_update_meetings_by_filter(self):
+        """Test updating every meeting matching a filter."""
+        self.manager.add_meeting("2023-10-01", "14:30", "Test Topics 1", tutor="Tutor A")
+        self.manager.add_meeting("2023-10-02", "15:30", "Test Topics 2", tutor="Tutor A")
+        self.manager.add_meeting("2023-10-03", "16:30", "Test Topics 3", tutor="Tutor B")
+
+        success, message = self.manager.update_meetings(filters={"tutor": "Tutor A"}, referrals="Wellbeing")
+        self.assertTrue(success, "Matching meetings should be updated")
+        self.assertEqual(message, "Updated 2 meeting(s) successfully!", "Both matching meetings should be updated")
+        self.assertEqual(len(self.manager.search_meetings("Wellbeing")), 2, "Only matching meetings should change")
+
+    def test_delete_meetings(self):
+        """Test deleting single and multiple meetings with an audit trail."""
+        for day in ("01", "02", "03"):
+            self.manager.add_meeting(f"2023-10-{day}", "14:30", f"Test Topics {day}")
+        ids = [meeting[0] for meeting in self.manager.view_all_meetings()]
+
+        success, message = self.manager.delete_meeting(ids[0])
+        self.assertTrue(success, "Meeting should be deleted successfully")
+
+        success, message = self.manager.delete_meetings(ids[1:] + [ids[0]])
+        self.assertEqual(message, "Deleted 2 meeting(s) successfully!", "Only existing meetings should be deleted")
+        self.assertEqual(self.manager.view_all_meetings(), [], "All meetings should be deleted")
+
+        success, message = self.manager.delete_meetings([ids[0]])
+        self.assertFalse(success, "Deleting missing meetings should return False")
+
+        conn = sqlite3.connect(TEST_DB_FILE)
+        audited = conn.execute(f"SELECT COUNT(*) FROM meeting_audit WHERE operation = 'delete' AND after IS NULL AND meeting_id IN ({', '.join('?' * len(ids))})", ids).fetchone()[0]
+        conn.close()
+        self.assertEqual(audited, 3, "Each deletion should be audited with its before image")
+
+    def test_history_and_search_include_archives(self):
+        """Test that student history pages and searches continue into archived years."""
+        self.manager.add_meeting("2021-05-01", "14:30", "Old Topics 1", student="Student A")
+        self.manager.add_meeting("2022-06-01", "15:30", "Old Topics 2", student="Student A")
+        self.manager.add_meeting("2023-10-01", "16:30", "New Topics", student="Student A")
+        self.manager.archive_meetings("2023-01-01")
+
+        page = self.manager.get_student_history("Student A", limit=2)
+        self.assertEqual([meeting[3] for meeting in page], ["New Topics", "Old Topics 2"], "History should continue into the archives")
+
+        last = page[-1]
+        page = self.manager.get_student_history("Student A", limit=2, before=(last[1], last[2], last[0]))
+        self.assertEqual([meeting[3] for meeting in page], ["Old Topics 1"], "Later pages should come from older archives")
+
+        self.assertEqual(self.manager.search_meetings("Old Topics"), [], "Archives should be excluded by default")
+        meetings = self.manager.search_meetings("Old Topics", include_archived=True)
+        self.assertEqual(len(meetings), 2, "Archived meetings should be searchable on request")
+
+    def test_archived_meetings_stay_reachable(self):
+        """Test that viewing, fetching, editing and deleting reach archived meetings."""
+        self.manager.add_meeting("2022-06-01", "15:30", "Old Topics 1", student="Student A")
+        self.manager.add_meeting("2022-07-01", "15:30", "Old Topics 2", student="Student A")
+        self.manager.add_meeting("2023-10-01", "16:30", "New Topics", student="Student A")
+        self.manager.archive_meetings("2023-01-01")
+        old_id, other_id = [meeting[0] for meeting in self.manager.view_all_meetings()[:2]]
+
+        self.assertEqual([meeting[3] for meeting in self.manager.view_all_meetings()], ["Old Topics 1", "Old Topics 2", "New Topics"], "View all should include archives")
+        self.assertEqual(self.manager.get_meeting(old_id)[3], "Old Topics 1", "Archived meetings should be fetched by id")
+        self.assertEqual([meeting[3] for meeting in self.manager.fuzzy_search_meetings("Old Topcs", include_archived=True)][:1], ["Old Topics 1"], "Fuzzy search should reach archives on request")
+
+        success, message = self.manager.update_meeting(old_id, topics="Edited Topics")
+        self.assertTrue(success, "Archived meetings should be editable")
+        self.assertEqual(self.manager.get_meeting(old_id)[3], "Edited Topics", "Edit should be saved")
+        success, message = self.manager.delete_meeting(other_id)
+        self.assertTrue(success, "Archived meetings should be deletable")
+        self.assertIsNone(self.manager.get_meeting(other_id), "Deleted meeting should be gone from the archive")
+
+    def test_find_conflicts_with_recurring(self):
+        """Test that recurring occurrences are included in conflict checks."""
+        self.manager.add_recurring_meeting("2023-10-02", "10:00", "Weekly Tutorial", tutor="Tutor A")
+
+        conflicts = self.manager.find_conflicts("2023-10-09", "10:15", 30, tutor="Tutor A")
+        self.assertEqual([(meeting[0][0], meeting[1]) for meeting in conflicts], [("S", "2023-10-09")], "Occurrence should conflict")
+
+        conflicts = self.manager.find_conflicts("2023-10-10", "10:15", 30, tutor="Tutor A")
+        self.assertEqual(conflicts, [], "Days without an occurrence should not conflict")
+
+    def test_add_recurring_meeting_reject_conflicts(self):
+        """Test that every occurrence of a new series is checked for conflicts."""
+        self.manager.add_meeting("2023-10-16", "10:30", "Test Topics 1", tutor="Tutor A")
+
+        conflicts = self.manager.find_series_conflicts("2023-10-02", "10:00", 60, tutor="Tutor A", end_date="2023-10-30")
+        self.assertEqual([meeting[1] for meeting in conflicts], ["2023-10-16"], "A later occurrence should conflict")
+
+        success, message = self.manager.add_recurring_meeting("2023-10-02", "10:00", "Weekly Tutorial", tutor="Tutor A",
+                                                              end_date="2023-10-30", reject_conflicts=True)
+        self.assertFalse(success, "Conflicting series should be rejected")
+
+    def test_end_and_delete_series(self):
+        """Test ending a series early and deleting it."""
+        self.manager.add_recurring_meeting("2023-10-02", "10:00", "Weekly Tutorial")
+        series_id = int(next(self.manager.expand_occurrences("2023-10-02", "2023-10-02"))[0][1:])
+
+        success, message = self.manager.end_series(series_id, "2023-10-10")
+        self.assertTrue(success, "Series should be ended successfully")
+        occurrences = list(self.manager.expand_occurrences("2023-10-01", "2023-10-31"))
+        self.assertEqual([meeting[1] for meeting in occurrences], ["2023-10-02", "2023-10-09"], "No occurrences should follow the end date")
+
+        success, message = self.manager.delete_series(series_id)
+        self.assertTrue(success, "Series should be deleted successfully")
+        self.assertEqual(list(self.manager.expand_occurrences("2023-10-01", "2023-10-31")), [], "Deleted series should have no occurrences")
+
+        success, message = self.manager.delete_series(series_id)
+        self.assertFalse(success, "Deleting a missing series should return False")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
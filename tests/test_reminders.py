@@ -0,0 +1,165 @@
+import unittest
+import asyncio
+import os
+import sqlite3
+from datetime import datetime
+from modules.meeting_manager import MeetingManager
+from modules.reminders import ReminderService, ReminderSink, FileSink, format_reminder
+
+# Test database and reminder file paths
+TEST_DB_FILE = "database/test_reminders.db"
+TEST_REMINDER_FILE = "logs/test_reminders.log"
+
+class RecordingSink(ReminderSink):
+    """Sink that keeps delivered reminders for inspection."""
+
+    def __init__(self):
+        self.delivered = []
+
+    def deliver(self, meeting, starts_at):
+        self.delivered.append((meeting[3], starts_at))
+
+class TestReminderService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test database before running any tests."""
+        os.makedirs(os.path.dirname(TEST_DB_FILE), exist_ok=True)
+        os.makedirs(os.path.dirname(TEST_REMINDER_FILE), exist_ok=True)
+        cls.manager = MeetingManager()
+        cls.manager.connect_db = lambda: sqlite3.connect(TEST_DB_FILE)
+        cls.manager.initialize_db()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the test database and reminder file after all tests are done."""
+        for path in (TEST_DB_FILE, TEST_REMINDER_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def setUp(self):
+        """Clear the database and create a service with a fixed clock before each test."""
+        conn = sqlite3.connect(TEST_DB_FILE)
+        conn.execute("DELETE FROM meetings")
+        conn.execute("DELETE FROM meeting_series")
+        conn.commit()
+        conn.close()
+
+        self.now = datetime(2023, 10, 1, 9, 0)
+        self.sink = RecordingSink()
+        self.service = ReminderService(self.manager, [self.sink], lead_minutes=15, window_hours=24, clock=lambda: self.now)
+
+    def test_load_window(self):
+        """Test that only meetings inside the next window are scheduled."""
+        self.manager.add_meeting("2023-10-01", "08:00", "Past Meeting")
+        self.manager.add_meeting("2023-10-01", "10:00", "Soon Meeting")
+        self.manager.add_meeting("2023-10-03", "10:00", "Later Meeting")
+        self.manager.add_recurring_meeting("2023-09-04", "08:30", "Weekly Tutorial")  # Mondays
+
+        self.service.load_window()
+        self.assertEqual(self.service.next_due(), datetime(2023, 10, 1, 9, 45), "Earliest reminder should be due first")
+
+        self.now = datetime(2023, 10, 2, 8, 59)
+        self.assertEqual(self.service.deliver_due(), 2, "Both reminders in the window should be delivered")
+        self.assertEqual([topics for topics, _ in self.sink.delivered], ["Soon Meeting", "Weekly Tutorial"], "Reminders should arrive in due order")
+        self.assertIsNone(self.service.next_due(), "No reminders should remain in the window")
+
+    def test_refresh(self):
+        """Test that added and removed meetings are picked up from the change feed."""
+        self.manager.add_meeting("2023-10-01", "12:00", "Removed Meeting")
+        self.service.load_window()
+
+        self.manager.add_meeting("2023-10-01", "10:00", "New Meeting")
+        conn = sqlite3.connect(TEST_DB_FILE)
+        conn.execute("DELETE FROM meetings WHERE topics = 'Removed Meeting'")
+        conn.commit()
+        conn.close()
+        self.service.refresh()
+
+        self.now = datetime(2023, 10, 1, 23, 0)
+        self.service.deliver_due()
+        self.assertEqual([topics for topics, _ in self.sink.delivered], ["New Meeting"], "Only the current meeting should be reminded")
+
+    def test_window_boundary(self):
+        """Test that reminders due before the window end are delivered on time, and only once."""
+        self.manager.add_meeting("2023-10-02", "09:10", "Edge Meeting")  # Due 08:55, before the 09:00 reload
+        self.manager.add_meeting("2023-10-02", "09:20", "Next Window Meeting")  # Due 09:05, after the reload
+
+        self.service.load_window()
+        self.now = datetime(2023, 10, 2, 8, 55)
+        self.assertEqual(self.service.deliver_due(), 1, "Reminder due inside the window should not wait for the reload")
+
+        self.now = datetime(2023, 10, 2, 9, 0)
+        self.service.load_window()
+        self.now = datetime(2023, 10, 2, 9, 5)
+        self.service.deliver_due()
+        self.assertEqual([topics for topics, _ in self.sink.delivered], ["Edge Meeting", "Next Window Meeting"], "Each reminder should be delivered once")
+
+    def test_refresh_series(self):
+        """Test that a series added or deleted after the load is picked up by refresh."""
+        self.service.load_window()
+        self.manager.add_recurring_meeting("2023-09-04", "08:30", "Weekly Tutorial")  # Mondays
+        self.service.refresh()
+        self.assertEqual(self.service.next_due(), datetime(2023, 10, 2, 8, 15), "New series occurrence should be scheduled")
+
+        self.manager.add_recurring_meeting("2023-09-04", "08:40", "Deleted Tutorial")
+        self.service.refresh()
+        conn = sqlite3.connect(TEST_DB_FILE)
+        series_id = conn.execute("SELECT id FROM meeting_series WHERE topics = 'Deleted Tutorial'").fetchone()[0]
+        conn.close()
+        self.manager.delete_series(series_id)
+        self.service.refresh()
+
+        self.now = datetime(2023, 10, 2, 8, 59)
+        self.service.deliver_due()
+        self.assertEqual([topics for topics, _ in self.sink.delivered], ["Weekly Tutorial"], "Deleted series should not be reminded")
+
+    def test_run_retries_database_errors(self):
+        """Test that a database error while loading is logged and retried instead of ending the loop."""
+        self.manager.add_meeting("2023-10-01", "09:10", "Imminent Meeting")
+        latest_change_token = self.manager.latest_change_token
+        failures = []
+
+        def failing_token():
+            if not failures:
+                failures.append(True)
+                raise sqlite3.OperationalError("database is locked")
+            return latest_change_token()
+
+        class StoppingSink(ReminderSink):
+            def deliver(sink, meeting, starts_at):
+                self.sink.deliver(meeting, starts_at)
+                self.service.stop()
+
+        self.manager.latest_change_token = failing_token
+        self.service.sinks = [StoppingSink()]
+        self.service.refresh_seconds = 0
+        try:
+            asyncio.run(asyncio.wait_for(self.service.run(), 5))
+        finally:
+            del self.manager.latest_change_token
+        self.assertEqual(failures, [True], "Load should have failed once")
+        self.assertEqual([topics for topics, _ in self.sink.delivered], ["Imminent Meeting"], "Reminder should be delivered after the retry")
+
+    def test_run(self):
+        """Test that the asyncio loop delivers a due reminder and stops."""
+        self.manager.add_meeting("2023-10-01", "09:10", "Imminent Meeting")
+
+        class StoppingSink(ReminderSink):
+            def deliver(sink, meeting, starts_at):
+                self.sink.deliver(meeting, starts_at)
+                self.service.stop()
+
+        self.service.sinks = [StoppingSink()]
+        asyncio.run(asyncio.wait_for(self.service.run(), 5))
+        self.assertEqual([topics for topics, _ in self.sink.delivered], ["Imminent Meeting"], "Reminder should be delivered by the loop")
+
+    def test_file_sink(self):
+        """Test that the file sink appends reminder text."""
+        meeting = (1, "2023-10-01", "10:00", "Test Topics", "", 60, "Tutor A", "Student A")
+        FileSink(TEST_REMINDER_FILE).deliver(meeting, datetime(2023, 10, 1, 10, 0))
+
+        with open(TEST_REMINDER_FILE) as f:
+            self.assertEqual(f.read(), format_reminder(meeting, datetime(2023, 10, 1, 10, 0)) + "\n", "Reminder should be written to the file")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file